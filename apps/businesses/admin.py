@@ -1,4 +1,5 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db.models import Exists, OuterRef
 from django.utils.html import format_html
 from .models import Business, Account
 
@@ -56,6 +57,45 @@ class BusinessAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     ]
     
     inlines = [AccountInline]
+    # 계좌는 거래 연쇄 삭제/잔액 재계산이 필요해 일괄 액션은 사업장에만 둠
+    actions = ['bulk_soft_delete', 'bulk_restore']
+
+    # 선택한 행 전체를 UPDATE 1번으로 처리
+    @admin.action(description='선택한 항목 소프트 삭제')
+    def bulk_soft_delete(self, request, queryset):
+        count = queryset.filter(is_active=True).soft_delete()
+        self.message_user(request, f"{count}건을 삭제했습니다.")
+
+    @admin.action(description='선택한 항목 복구')
+    def bulk_restore(self, request, queryset):
+        # unique_active_business_name_per_user: 같은 이름의 활성 사업장이 있거나
+        # 선택한 항목끼리 이름이 겹치면 가장 최근에 삭제된 1건만 복구
+        name_taken = Business.objects.filter(
+            user=OuterRef('user'), name=OuterRef('name'), is_active=True
+        )
+        rows = (
+            queryset.filter(is_active=False)
+            .annotate(name_taken=Exists(name_taken))
+            .order_by('-updated_at')
+            .values_list('pk', 'user_id', 'name', 'name_taken')
+        )
+
+        restore_pks, skipped, seen = [], [], set()
+        for pk, user_id, name, taken in rows:
+            if taken or (user_id, name) in seen:
+                skipped.append(name)
+                continue
+            seen.add((user_id, name))
+            restore_pks.append(pk)
+
+        count = Business.objects.filter(pk__in=restore_pks).restore()
+        self.message_user(request, f"{count}건을 복구했습니다.")
+        if skipped:
+            self.message_user(
+                request,
+                f"같은 이름의 사업장이 있어 {len(skipped)}건은 복구하지 않았습니다: {', '.join(skipped)}",
+                messages.WARNING,
+            )
 
     @admin.display(description='사업자 번호')
     def get_masked_registration_number(self, obj):
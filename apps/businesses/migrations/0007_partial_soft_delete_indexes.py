@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-16 20:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('businesses', '0006_remove_business_branch_code_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', '-created_at', '-id'], name='account_active_by_user'),
+        ),
+        migrations.AddIndex(
+            model_name='business',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['user', '-updated_at', '-id'], name='business_deleted_by_user'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# icontains는 PostgreSQL에서 UPPER(col) LIKE UPPER('%검색어%')로 변환되므로
+# 같은 UPPER 표현식에 trigram GIN 인덱스를 걸어야 플래너가 사용할 수 있습니다.
+# pg_trgm이 없는 DB에서도 테스트(--no-migrations)가 돌도록 모델 Meta가 아닌
+# 마이그레이션에만 두고, PostgreSQL이 아니면(SQLite 개발 DB 등) 건너뜁니다.
+TRIGRAM_INDEXES = [
+    ('account_name_trgm', 'name'),
+    ('account_bank_name_trgm', 'bank_name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    for index_name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON accounts '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops);'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('businesses', '0007_partial_soft_delete_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-16 21:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('businesses', '0008_account_search_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='business',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'name'], name='business_active_by_user'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+# business_list 검색어 필터(name/location icontains)용 trigram GIN 인덱스
+# pg_trgm 확장은 0008에서 이미 설치했고, 0008과 같이 PostgreSQL에서만 만듭니다.
+TRIGRAM_INDEXES = [
+    ('business_name_trgm', 'name'),
+    ('business_location_trgm', 'location'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON businesses '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops);'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('businesses', '0009_business_active_by_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
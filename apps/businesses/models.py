@@ -12,7 +12,7 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import F, Sum
 
-from apps.core.models import SoftDeleteModel
+from apps.core.models import SoftDeleteModel, SoftDeleteQuerySet
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +34,27 @@ class Business(SoftDeleteModel):
     ]
     branch_type = models.CharField(max_length=10, choices=BRANCH_TYPE_CHOICES, default='main', db_index=True)
 
+    # 사업장은 행 단위 부가 처리가 없어 일괄 소프트 삭제/복구(UPDATE 1번)를 허용
+    objects = SoftDeleteQuerySet.as_manager()
+
     class Meta:
         db_table = 'businesses'
         ordering = ['name']
         indexes = [
             models.Index(fields=['user', 'is_active', 'name']),
+            # 활성 사업장 목록 (business_list 이름순 정렬과 동일)
+            models.Index(
+                fields=['user', 'name'],
+                condition=models.Q(is_active=True),
+                name='business_active_by_user',
+            ),
+            # 삭제된 사업장 목록 (커서 페이지네이션 정렬과 동일)
+            models.Index(
+                fields=['user', '-updated_at', '-id'],
+                condition=models.Q(is_active=False),
+                name='business_deleted_by_user',
+            ),
+            # name/location 검색용 trigram GIN 인덱스는 마이그레이션 0010(PostgreSQL 전용)에만 있습니다.
         ]
         constraints = [
             models.UniqueConstraint(
@@ -131,6 +147,14 @@ class Account(SoftDeleteModel):
         indexes = [
             models.Index(fields=['user', 'is_active', 'account_type']),
             models.Index(fields=['business', 'is_active']),
+            # 활성 계좌 목록 (account_list 커서 정렬 (created_at, id)과 동일)
+            models.Index(
+                fields=['user', '-created_at', '-id'],
+                condition=models.Q(is_active=True),
+                name='account_active_by_user',
+            ),
+            # name/bank_name 검색용 trigram GIN 인덱스는 pg_trgm이 필요해
+            # 마이그레이션 0008(PostgreSQL 전용)에서만 생성합니다.
         ]
 
     def __str__(self):
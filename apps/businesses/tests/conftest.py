@@ -3,38 +3,16 @@
 # =============================================================================
 
 import pytest
-from django.conf import settings
-from django.test import Client
 from django.contrib.auth.models import User
 from decimal import Decimal
 
 from apps.businesses.models import Business, Account
 
 
-# =============================================================================
-# pytest-django 설정
-# =============================================================================
-
-@pytest.fixture(scope='session')
-def django_db_setup():
-    """데이터베이스 설정"""
-    settings.DATABASES['default'] = {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
-        'ATOMIC_REQUESTS': True,
-    }
-
-
 # =============================================================================
 # 공통 Fixtures
 # =============================================================================
 
-@pytest.fixture
-def client():
-    """테스트 클라이언트"""
-    return Client()
-
-
 @pytest.fixture
 def user(db):
     """기본 테스트 사용자"""
@@ -70,7 +48,7 @@ def superuser(db):
 @pytest.fixture
 def authenticated_client(client, user):
     """로그인된 클라이언트"""
-    client.login(username='testuser', password='testpass123')
+    client.force_login(user)
     client.user = user  # 편의를 위해 user 속성 추가
     return client
 
@@ -78,7 +56,7 @@ def authenticated_client(client, user):
 @pytest.fixture
 def admin_client(client, superuser):
     """관리자로 로그인된 클라이언트"""
-    client.login(username='admin', password='adminpass123')
+    client.force_login(superuser)
     client.user = superuser
     return client
 
@@ -126,17 +104,16 @@ def deleted_business(db, user):
 @pytest.fixture
 def multiple_businesses(db, user):
     """여러 사업장 (페이지네이션 테스트용)"""
-    businesses = []
-    for i in range(30):
-        business = Business.objects.create(
+    return Business.objects.bulk_create([
+        Business(
             user=user,
             name=f'사업장{i:02d}',
             location=f'위치{i}',
             business_type='소매업' if i % 2 == 0 else '제조업',
             branch_type='main' if i % 3 == 0 else 'branch'
         )
-        businesses.append(business)
-    return businesses
+        for i in range(30)
+    ])
 
 
 # =============================================================================
@@ -200,10 +177,8 @@ def low_balance_account(db, user):
 @pytest.fixture
 def multiple_accounts(db, user, business):
     """여러 계좌 (페이지네이션 및 필터링 테스트용)"""
-    accounts = []
-    
-    for i in range(30):
-        account = Account.objects.create(
+    return Account.objects.bulk_create([
+        Account(
             user=user,
             business=business if i % 2 == 0 else None,
             name=f'계좌{i:02d}',
@@ -212,9 +187,8 @@ def multiple_accounts(db, user, business):
             account_type='business' if i % 2 == 0 else 'personal',
             balance=Decimal('100000.00') * (i + 1)
         )
-        accounts.append(account)
-    
-    return accounts
+        for i in range(30)
+    ])
 
 
 # =============================================================================
@@ -1,3 +1,4 @@
+from django.contrib import messages
 from django.test import TestCase
 from django.contrib.admin.sites import AdminSite
 from apps.businesses.models import Business, Account
@@ -38,6 +39,51 @@ class BusinessAdminTest(TestCase):
         count = self.admin.get_account_count(self.business)
         self.assertEqual(count, "1개")
 
+    def test_bulk_soft_delete_and_restore(self):
+        other = Business.objects.create(name="사업장B", user=self.user)
+        queryset = Business.objects.filter(pk__in=[self.business.pk, other.pk])
+        self.admin.message_user = lambda request, message, level=None: None
+
+        with self.assertNumQueries(1):
+            self.admin.bulk_soft_delete(None, queryset)
+        self.assertEqual(Business.active.filter(user=self.user).count(), 0)
+
+        with self.assertNumQueries(2):
+            self.admin.bulk_restore(None, queryset)
+        self.assertEqual(Business.active.filter(user=self.user).count(), 2)
+
+    def test_account_queryset_has_no_bulk_soft_delete(self):
+        # 계좌는 거래 연쇄 삭제/잔액 재계산 때문에 행 단위 soft_delete만 허용
+        self.assertFalse(hasattr(Account.objects.all(), 'soft_delete'))
+        self.assertFalse(hasattr(Account.active.all(), 'restore'))
+
+    def test_bulk_restore_skips_name_taken_by_active_business(self):
+        self.business.soft_delete()
+        other = Business.objects.create(name="사업장B", user=self.user, is_active=False)
+        Business.objects.create(name="테스트사업장", user=self.user)
+        sent = []
+        self.admin.message_user = lambda request, message, level=None: sent.append(message)
+
+        self.admin.bulk_restore(None, Business.objects.filter(pk__in=[self.business.pk, other.pk]))
+
+        self.business.refresh_from_db()
+        other.refresh_from_db()
+        self.assertFalse(self.business.is_active)
+        self.assertTrue(other.is_active)
+        self.assertEqual(sent[0], "1건을 복구했습니다.")
+        self.assertIn("테스트사업장", sent[1])
+
+    def test_bulk_restore_keeps_one_of_duplicate_names_in_selection(self):
+        self.business.soft_delete()
+        twin = Business.objects.create(name="테스트사업장", user=self.user, is_active=False)
+        sent = []
+        self.admin.message_user = lambda request, message, level=None: sent.append(level)
+
+        self.admin.bulk_restore(None, Business.objects.filter(pk__in=[self.business.pk, twin.pk]))
+
+        self.assertEqual(Business.active.filter(user=self.user, name="테스트사업장").count(), 1)
+        self.assertEqual(sent, [None, messages.WARNING])
+
 class AccountAdminTest(TestCase):
     def setUp(self):
         self.site = AdminSite()
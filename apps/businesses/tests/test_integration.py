@@ -398,14 +398,13 @@ class TestPaginationIntegration:
         # 1페이지 (20개)
         response = authenticated_client.get(url, {
             'account_type': 'business',
-            'page': 1
         })
         assert len(response.context['page_obj']) == 20
         
-        # 2페이지 (5개)
+        # 2페이지 (5개, 커서)
         response = authenticated_client.get(url, {
             'account_type': 'business',
-            'page': 2
+            'cursor': response.context['next_cursor']
         })
         assert len(response.context['page_obj']) == 5
         
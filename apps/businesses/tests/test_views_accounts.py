@@ -4,24 +4,62 @@
 
 import pytest
 from decimal import Decimal
+from types import MappingProxyType
 from django.contrib.auth.models import User
 from django.urls import reverse
-from django.test import Client
 from django.contrib.messages import get_messages
+from pytest_django.asserts import assertTemplateUsed
 from unittest.mock import patch, MagicMock
 
 from apps.businesses.models import Business, Account
 
 
 # =============================================================================
-# Fixtures
+# 공통 상수
 # =============================================================================
 
-@pytest.fixture
-def client():
-    """테스트 클라이언트"""
-    return Client()
+URL_ACCOUNT_LIST = reverse('businesses:account_list')
+URL_ACCOUNT_CREATE = reverse('businesses:account_create')
+URL_ACCOUNT_SUMMARY = reverse('businesses:account_summary')
+
+# 잔액 상수 (테스트 본문에서 매번 Decimal 문자열을 파싱하지 않도록)
+D50K = Decimal('50000')
+D100K = Decimal('100000')
+D300K = Decimal('300000')
+D500K = Decimal('500000')
+D800K = Decimal('800000')
+
+# 계좌 생성 POST 기본값 (읽기 전용, 테스트에서는 {**VALID_ACCOUNT_DATA, ...}로 복사)
+VALID_ACCOUNT_DATA = MappingProxyType({
+    'name': '새 계좌',
+    'bank_name': '국민은행',
+    'account_number': '1234-5678-9012-3456',
+    'account_type': 'business',
+})
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
 
+def make_account(user, **overrides):
+    """
+    테스트용 계좌 인스턴스 생성 (저장하지 않음)
+
+    save() 대신 Account.objects.bulk_create([...])로 한 번에 INSERT 합니다.
+    """
+    fields = {
+        'name': '테스트 계좌',
+        'bank_name': '은행',
+        'account_number': '9999',
+    }
+    fields.update(overrides)
+    return Account(user=user, **fields)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
 
 @pytest.fixture
 def user(db):
@@ -52,7 +90,7 @@ def other_user(db):
 @pytest.fixture
 def authenticated_client(client, user):
     """로그인된 클라이언트"""
-    client.login(username='tester', password='testpass123')
+    client.force_login(user)
     return client
 
 
@@ -70,23 +108,25 @@ def business(db, user):
 @pytest.fixture
 def account(db, user, business):
     """테스트용 계좌"""
-    return Account.objects.create(
-        user=user,
-        business=business,
-        name='국민은행 주거래',
-        bank_name='국민은행',
-        account_number='1234-5678-9012-3456',
-        account_type='business',
-        balance=Decimal('1000000.00')
-    )
+    [account] = Account.objects.bulk_create([
+        make_account(
+            user,
+            business=business,
+            name='국민은행 주거래',
+            bank_name='국민은행',
+            account_number='1234-5678-9012-3456',
+            account_type='business',
+            balance=Decimal('1000000.00'),
+        )
+    ])
+    return account
 
 
 @pytest.fixture
 def multiple_accounts(db, user, business):
     """여러 개의 계좌 생성"""
-    accounts = []
-    for i in range(25):  # 페이지네이션 테스트용
-        account = Account.objects.create(
+    return Account.objects.bulk_create([
+        Account(
             user=user,
             business=business if i % 2 == 0 else None,
             name=f'계좌{i}',
@@ -95,8 +135,8 @@ def multiple_accounts(db, user, business):
             account_type='business' if i % 2 == 0 else 'personal',
             balance=Decimal('100000.00') * (i + 1)
         )
-        accounts.append(account)
-    return accounts
+        for i in range(25)  # 페이지네이션 테스트용
+    ])
 
 
 # =============================================================================
@@ -109,16 +149,16 @@ class TestAccountListView:
     
     def test_account_list_requires_login(self, client):
         """로그인 필요 테스트"""
-        url = reverse('businesses:account_list')
-        response = client.get(url)
+        response = client.get(URL_ACCOUNT_LIST)
         
         assert response.status_code == 302  # 리다이렉트
         assert '/login/' in response.url
     
-    def test_account_list_success(self, authenticated_client, account):
+    def test_account_list_success(self, authenticated_client, account, django_assert_num_queries):
         """계좌 목록 조회 성공"""
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url)
+        # savepoint 2 + 세션/사용자 2 + 통계 + 사업장 선택지 + 목록 (계좌의 사업장은 JOIN으로 로드)
+        with django_assert_num_queries(7):
+            response = authenticated_client.get(URL_ACCOUNT_LIST)
         
         assert response.status_code == 200
         assert 'page_obj' in response.context
@@ -128,15 +168,11 @@ class TestAccountListView:
     def test_account_list_only_shows_own_accounts(self, authenticated_client, account, other_user):
         """본인 계좌만 표시"""
         # 다른 사용자의 계좌
-        other_account = Account.objects.create(
-            user=other_user,
-            name='남의 계좌',
-            bank_name='은행',
-            account_number='9999-9999-9999'
-        )
+        [other_account] = Account.objects.bulk_create([
+            make_account(other_user, account_number='9999-9999-9999')
+        ])
         
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_ACCOUNT_LIST)
         
         accounts = list(response.context['page_obj'])
         assert account in accounts
@@ -157,8 +193,7 @@ class TestAccountListView:
             account_type='personal'
         )
         
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url, {'account_type': 'business'})
+        response = authenticated_client.get(URL_ACCOUNT_LIST, {'account_type': 'business'})
         
         accounts = list(response.context['page_obj'])
         assert business_account in accounts
@@ -178,8 +213,7 @@ class TestAccountListView:
             bank_name='은행', account_number='2222'
         )
         
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url, {'business': business1.pk})
+        response = authenticated_client.get(URL_ACCOUNT_LIST, {'business': business1.pk})
         
         accounts = list(response.context['page_obj'])
         assert account1 in accounts
@@ -196,8 +230,7 @@ class TestAccountListView:
             bank_name='신한은행', account_number='2222'
         )
         
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url, {'search': '국민은행'})
+        response = authenticated_client.get(URL_ACCOUNT_LIST, {'search': '국민은행'})
         
         accounts = list(response.context['page_obj'])
         assert account1 in accounts
@@ -214,52 +247,55 @@ class TestAccountListView:
             bank_name='신한은행', account_number='2222'
         )
         
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url, {'search': '신한'})
+        response = authenticated_client.get(URL_ACCOUNT_LIST, {'search': '신한'})
         
         accounts = list(response.context['page_obj'])
         assert account2 in accounts
         assert account1 not in accounts
     
-    def test_account_list_pagination(self, authenticated_client, multiple_accounts):
-        """페이지네이션 테스트 (페이지당 20개)"""
-        url = reverse('businesses:account_list')
+    def test_account_list_pagination(self, authenticated_client, multiple_accounts, django_assert_num_queries):
+        """페이지네이션 테스트 (페이지당 20개, 페이지와 무관하게 쿼리 수 고정)"""
         
         # 1페이지
-        response = authenticated_client.get(url)
+        # savepoint 2 + 세션/사용자 2 + 통계(COUNT 겸용) + 사업장 선택지 + 목록
+        with django_assert_num_queries(7):
+            response = authenticated_client.get(URL_ACCOUNT_LIST)
         assert len(response.context['page_obj']) == 20
         
-        # 2페이지
-        response = authenticated_client.get(url, {'page': 2})
+        next_cursor = response.context['next_cursor']
+        assert next_cursor
+        
+        # 2페이지 (커서)
+        with django_assert_num_queries(7):
+            response = authenticated_client.get(URL_ACCOUNT_LIST, {'cursor': next_cursor})
         assert len(response.context['page_obj']) == 5  # 총 25개 중 나머지 5개
+        assert response.context['next_cursor'] is None
     
     def test_account_list_summary_statistics(self, authenticated_client, user):
         """요약 통계 확인"""
         Account.objects.create(
             user=user, name='계좌1', bank_name='은행',
             account_number='1111', account_type='business',
-            balance=Decimal('500000')
+            balance=D500K
         )
         Account.objects.create(
             user=user, name='계좌2', bank_name='은행',
             account_number='2222', account_type='personal',
-            balance=Decimal('300000')
+            balance=D300K
         )
         
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_ACCOUNT_LIST)
         
         assert response.context['total_count'] == 2
         assert response.context['business_count'] == 1
         assert response.context['personal_count'] == 1
-        assert response.context['total_balance'] == Decimal('800000')
+        assert response.context['total_balance'] == D800K
     
     def test_account_list_template_used(self, authenticated_client, account):
         """올바른 템플릿 사용 확인"""
-        url = reverse('businesses:account_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_ACCOUNT_LIST)
         
-        assert 'businesses/account_list.html' in [t.name for t in response.templates]
+        assertTemplateUsed(response, 'businesses/account_list.html')
 
 
 # =============================================================================
@@ -288,12 +324,7 @@ class TestAccountDetailView:
     
     def test_account_detail_other_user_account_404(self, authenticated_client, other_user):
         """다른 사용자의 계좌 조회 시 404"""
-        other_account = Account.objects.create(
-            user=other_user,
-            name='남의 계좌',
-            bank_name='은행',
-            account_number='9999'
-        )
+        [other_account] = Account.objects.bulk_create([make_account(other_user)])
         
         url = reverse('businesses:account_detail', kwargs={'pk': other_account.pk})
         response = authenticated_client.get(url)
@@ -331,31 +362,22 @@ class TestAccountCreateView:
     
     def test_account_create_get_requires_login(self, client):
         """로그인 필요 (GET)"""
-        url = reverse('businesses:account_create')
-        response = client.get(url)
+        response = client.get(URL_ACCOUNT_CREATE)
         
         assert response.status_code == 302
     
     def test_account_create_get_success(self, authenticated_client):
         """계좌 생성 폼 표시"""
-        url = reverse('businesses:account_create')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_ACCOUNT_CREATE)
         
         assert response.status_code == 200
         assert 'form' in response.context
     
     def test_account_create_post_success(self, authenticated_client, business):
         """계좌 생성 성공"""
-        url = reverse('businesses:account_create')
-        data = {
-            'name': '새 계좌',
-            'bank_name': '국민은행',
-            'account_number': '1234-5678-9012-3456',
-            'account_type': 'business',
-            'business': business.pk,
-        }
+        data = {**VALID_ACCOUNT_DATA, 'business': business.pk}
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_ACCOUNT_CREATE, data)
         
         # 리다이렉트 확인
         assert response.status_code == 302
@@ -369,14 +391,13 @@ class TestAccountCreateView:
     
     def test_account_create_post_invalid_data(self, authenticated_client):
         """유효하지 않은 데이터로 생성 시도"""
-        url = reverse('businesses:account_create')
         data = {
             'name': '',  # 빈 값
             'bank_name': '은행',
             'account_number': '123',  # 너무 짧음
         }
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_ACCOUNT_CREATE, data)
         
         # 폼 에러로 같은 페이지 표시
         assert response.status_code == 200
@@ -385,30 +406,23 @@ class TestAccountCreateView:
     
     def test_account_create_sets_user_automatically(self, authenticated_client, user):
         """계좌 생성 시 사용자 자동 설정"""
-        url = reverse('businesses:account_create')
-        data = {
-            'name': '새 계좌',
-            'bank_name': '은행',
-            'account_number': '1234-5678-9012-3456',
-            'account_type': 'personal',
-        }
+        data = {**VALID_ACCOUNT_DATA, 'bank_name': '은행', 'account_type': 'personal'}
         
-        authenticated_client.post(url, data)
+        authenticated_client.post(URL_ACCOUNT_CREATE, data)
         
         account = Account.objects.get(name='새 계좌')
         assert account.user == user
     
     def test_account_create_duplicate_account_number(self, authenticated_client, account):
         """중복 계좌번호 생성 시도"""
-        url = reverse('businesses:account_create')
         data = {
-            'name': '새 계좌',
+            **VALID_ACCOUNT_DATA,
             'bank_name': '은행',
             'account_number': account.account_number,  # 중복
             'account_type': 'personal',
         }
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_ACCOUNT_CREATE, data)
         
         # 에러 메시지 확인
         messages = list(get_messages(response.wsgi_request))
@@ -446,20 +460,14 @@ class TestAccountUpdateView:
         
         assert response.status_code == 302
         
-        account.refresh_from_db()
-        assert account.name == '수정된 계좌명'
+        assert Account.objects.filter(pk=account.pk, name='수정된 계좌명').exists()
         
         messages = list(get_messages(response.wsgi_request))
         assert any('수정되었습니다' in str(m) for m in messages)
     
     def test_account_update_other_user_account_404(self, authenticated_client, other_user):
         """다른 사용자의 계좌 수정 시도"""
-        other_account = Account.objects.create(
-            user=other_user,
-            name='남의 계좌',
-            bank_name='은행',
-            account_number='9999'
-        )
+        [other_account] = Account.objects.bulk_create([make_account(other_user)])
         
         url = reverse('businesses:account_update', kwargs={'pk': other_account.pk})
         response = authenticated_client.get(url)
@@ -482,7 +490,7 @@ class TestAccountDeleteView:
         
         assert response.status_code == 200
         assert response.context['account'] == account
-        assert 'transaction_count' in response.context
+        assert response.context['transaction_count'] == 0
     
     def test_account_delete_post_success(self, authenticated_client, account):
         """계좌 소프트 삭제 성공"""
@@ -491,20 +499,14 @@ class TestAccountDeleteView:
         
         assert response.status_code == 302
         
-        account.refresh_from_db()
-        assert account.is_active is False
+        assert Account.objects.filter(pk=account.pk, is_active=False).exists()
         
         messages = list(get_messages(response.wsgi_request))
         assert any('삭제되었습니다' in str(m) for m in messages)
     
     def test_account_delete_other_user_account_404(self, authenticated_client, other_user):
         """다른 사용자의 계좌 삭제 시도"""
-        other_account = Account.objects.create(
-            user=other_user,
-            name='남의 계좌',
-            bank_name='은행',
-            account_number='9999'
-        )
+        [other_account] = Account.objects.bulk_create([make_account(other_user)])
         
         url = reverse('businesses:account_delete', kwargs={'pk': other_account.pk})
         response = authenticated_client.post(url)
@@ -534,8 +536,7 @@ class TestAccountRestoreView:
         """계좌 복구 성공"""
         # 삭제
         account.soft_delete()
-        account.refresh_from_db()
-        assert account.is_active is False
+        assert Account.objects.filter(pk=account.pk, is_active=False).exists()
         
         # 복구
         url = reverse('businesses:account_restore', kwargs={'pk': account.pk})
@@ -543,8 +544,7 @@ class TestAccountRestoreView:
         
         # 검증
         assert response.status_code == 302
-        account.refresh_from_db()
-        assert account.is_active is True 
+        assert Account.objects.filter(pk=account.pk, is_active=True).exists()
     
     def test_account_restore_already_active_warning(self, authenticated_client, account):
         """이미 활성 상태인 계좌 복구 시도"""
@@ -553,6 +553,42 @@ class TestAccountRestoreView:
         
         messages = list(get_messages(response.wsgi_request))
         assert any('이미 활성' in str(m) for m in messages)
+    
+    def test_account_restore_other_user_404(self, authenticated_client, other_user):
+        """다른 사용자의 삭제된 계좌는 404"""
+        [other_account] = Account.objects.bulk_create([
+            make_account(other_user, is_active=False)
+        ])
+        
+        url = reverse('businesses:account_restore', kwargs={'pk': other_account.pk})
+        response = authenticated_client.get(url)
+        
+        assert response.status_code == 404
+
+
+# =============================================================================
+# account_deleted_list 뷰 테스트
+# =============================================================================
+
+@pytest.mark.django_db
+class TestAccountDeletedListView:
+    """삭제된 계좌 목록 뷰 테스트"""
+    
+    def test_account_deleted_list_counts_once(self, authenticated_client, user, django_assert_num_queries):
+        """삭제된 계좌만 표시하고 COUNT(*)는 한 번만 실행"""
+        active, deleted = Account.objects.bulk_create([
+            make_account(user, account_number='1111'),
+            make_account(user, account_number='2222', is_active=False),
+        ])
+        
+        # savepoint 2 + 세션/사용자 2 + COUNT + 목록
+        with django_assert_num_queries(6):
+            response = authenticated_client.get(reverse('businesses:account_deleted_list'))
+        
+        assert response.context['deleted_count'] == 1
+        accounts = list(response.context['page_obj'])
+        assert deleted in accounts
+        assert active not in accounts
 
 
 # =============================================================================
@@ -565,34 +601,34 @@ class TestAccountSummaryView:
     
     def test_account_summary_requires_login(self, client):
         """로그인 필요"""
-        url = reverse('businesses:account_summary')
-        response = client.get(url)
+        response = client.get(URL_ACCOUNT_SUMMARY)
         
         assert response.status_code == 302
     
-    def test_account_summary_success(self, authenticated_client, user):
+    def test_account_summary_success(self, authenticated_client, user, django_assert_num_queries):
         """요약 대시보드 표시"""
         # 테스트 데이터 생성
         business = Business.objects.create(user=user, name='사업장')
         Account.objects.create(
             user=user, business=business, name='계좌1',
             bank_name='은행', account_number='1111',
-            account_type='business', balance=Decimal('500000')
+            account_type='business', balance=D500K
         )
         Account.objects.create(
             user=user, name='계좌2',
             bank_name='은행', account_number='2222',
-            account_type='personal', balance=Decimal('300000')
+            account_type='personal', balance=D300K
         )
         
-        url = reverse('businesses:account_summary')
-        response = authenticated_client.get(url)
+        # savepoint 2 + 세션/사용자 2 + 통계 집계 1 + 사업장별/은행별/잔액부족 3
+        with django_assert_num_queries(8):
+            response = authenticated_client.get(URL_ACCOUNT_SUMMARY)
         
         assert response.status_code == 200
         assert response.context['total_count'] == 2
         assert response.context['business_count'] == 1
         assert response.context['personal_count'] == 1
-        assert response.context['total_balance'] == Decimal('800000')
+        assert response.context['total_balance'] == D800K
     
     def test_account_summary_low_balance_accounts(self, authenticated_client, user):
         """잔액 부족 계좌 표시"""
@@ -600,12 +636,11 @@ class TestAccountSummaryView:
         Account.objects.create(
             user=user, name='부족계좌',
             bank_name='은행', account_number='1111',
-            balance=Decimal('50000')
+            balance=D50K
         )
         
-        url = reverse('businesses:account_summary')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_ACCOUNT_SUMMARY)
         
         low_balance_accounts = response.context['low_balance_accounts']
         assert len(low_balance_accounts) == 1
-        assert low_balance_accounts[0].balance < Decimal('100000')
\ No newline at end of file
+        assert low_balance_accounts[0].balance < D100K
\ No newline at end of file
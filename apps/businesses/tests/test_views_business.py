@@ -3,24 +3,45 @@
 # =============================================================================
 
 import pytest
+from datetime import datetime, timezone as dt_timezone
 from decimal import Decimal
+from types import MappingProxyType
 from django.contrib.auth.models import User
 from django.urls import reverse
-from django.test import Client
+from django.utils import timezone
 from django.contrib.messages import get_messages
+from pytest_django.asserts import assertTemplateUsed
 
 from apps.businesses.models import Business, Account
 
 
 # =============================================================================
-# Fixtures
+# 공통 상수
 # =============================================================================
 
-@pytest.fixture
-def client():
-    """테스트 클라이언트"""
-    return Client()
+URL_BUSINESS_LIST = reverse('businesses:business_list')
+URL_BUSINESS_CREATE = reverse('businesses:business_create')
+URL_BUSINESS_DELETED_LIST = reverse('businesses:business_deleted_list')
+URL_BUSINESS_DELETED_EXPORT = reverse('businesses:business_deleted_export')
+
+# 잔액 상수 (테스트 본문에서 매번 Decimal 문자열을 파싱하지 않도록)
+D300K = Decimal('300000')
+D500K = Decimal('500000')
+D800K = Decimal('800000')
 
+# 사업장 생성 POST 기본값 (읽기 전용, 테스트에서는 {**VALID_BUSINESS_DATA, ...}로 복사)
+VALID_BUSINESS_DATA = MappingProxyType({
+    'name': '새 사업장',
+    'location': '서울시 강남구',
+    'business_type': '소매업',
+    'branch_type': 'main',
+    'registration_number': '123-45-67890',
+})
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
 
 @pytest.fixture
 def user(db):
@@ -45,7 +66,7 @@ def other_user(db):
 @pytest.fixture
 def authenticated_client(client, user):
     """로그인된 클라이언트"""
-    client.login(username='testuser', password='testpass123')
+    client.force_login(user)
     return client
 
 
@@ -76,17 +97,16 @@ def branch_business(db, user):
 @pytest.fixture
 def multiple_businesses(db, user):
     """여러 사업장 생성 (페이지네이션 테스트용)"""
-    businesses = []
-    for i in range(25):
-        business = Business.objects.create(
+    return Business.objects.bulk_create([
+        Business(
             user=user,
             name=f'사업장{i:02d}',
             location=f'위치{i}',
             business_type='소매업' if i % 2 == 0 else '제조업',
             branch_type='main' if i % 3 == 0 else 'branch'
         )
-        businesses.append(business)
-    return businesses
+        for i in range(25)
+    ])
 
 
 # =============================================================================
@@ -99,16 +119,14 @@ class TestBusinessListView:
     
     def test_business_list_requires_login(self, client):
         """로그인 필요 테스트"""
-        url = reverse('businesses:business_list')
-        response = client.get(url)
+        response = client.get(URL_BUSINESS_LIST)
         
         assert response.status_code == 302
         assert '/login/' in response.url
     
     def test_business_list_success(self, authenticated_client, business):
         """사업장 목록 조회 성공"""
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_LIST)
         
         assert response.status_code == 200
         assert 'page_obj' in response.context
@@ -122,28 +140,26 @@ class TestBusinessListView:
             name='남의 사업장'
         )
         
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_LIST)
         
         businesses = list(response.context['page_obj'])
         assert business in businesses
         assert other_business not in businesses
     
-    def test_business_list_filter_by_branch_type(self, authenticated_client, business, branch_business):
+    @pytest.mark.parametrize('branch_type, expected, not_expected', [
+        ('main', 'business', 'branch_business'),     # 본점만 필터링
+        ('branch', 'branch_business', 'business'),   # 지점만 필터링
+    ])
+    def test_business_list_filter_by_branch_type(
+        self, authenticated_client, business, branch_business, request,
+        branch_type, expected, not_expected
+    ):
         """지점 구분으로 필터링"""
-        url = reverse('businesses:business_list')
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'branch_type': branch_type})
         
-        # 본점만 필터링
-        response = authenticated_client.get(url, {'branch_type': 'main'})
         businesses = list(response.context['page_obj'])
-        assert business in businesses
-        assert branch_business not in businesses
-        
-        # 지점만 필터링
-        response = authenticated_client.get(url, {'branch_type': 'branch'})
-        businesses = list(response.context['page_obj'])
-        assert branch_business in businesses
-        assert business not in businesses
+        assert request.getfixturevalue(expected) in businesses
+        assert request.getfixturevalue(not_expected) not in businesses
     
     def test_business_list_filter_by_business_type(self, authenticated_client, user):
         """업종으로 필터링"""
@@ -154,8 +170,7 @@ class TestBusinessListView:
             user=user, name='공장', business_type='제조업'
         )
         
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'business_type': '소매업'})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'business_type': '소매업'})
         
         businesses = list(response.context['page_obj'])
         assert retail in businesses
@@ -166,8 +181,7 @@ class TestBusinessListView:
         business1 = Business.objects.create(user=user, name='강남점')
         business2 = Business.objects.create(user=user, name='역삼점')
         
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'search': '강남'})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'search': '강남'})
         
         businesses = list(response.context['page_obj'])
         assert business1 in businesses
@@ -182,8 +196,7 @@ class TestBusinessListView:
             user=user, name='점포2', location='서울시 서초구'
         )
         
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'search': '강남'})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'search': '강남'})
         
         businesses = list(response.context['page_obj'])
         assert business1 in businesses
@@ -195,24 +208,25 @@ class TestBusinessListView:
         Business.objects.create(user=user, name='가점')
         Business.objects.create(user=user, name='나점')
         
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_LIST)
         
         businesses = list(response.context['page_obj'])
         names = [b.name for b in businesses]
         
         assert names == ['가점', '나점', '다점']
     
-    def test_business_list_pagination(self, authenticated_client, multiple_businesses):
-        """페이지네이션 테스트 (페이지당 20개)"""
-        url = reverse('businesses:business_list')
+    def test_business_list_pagination(self, authenticated_client, multiple_businesses, django_assert_num_queries):
+        """페이지네이션 테스트 (페이지당 20개, 페이지와 무관하게 쿼리 수 고정)"""
         
         # 1페이지
-        response = authenticated_client.get(url)
+        # savepoint 2 + 세션/사용자 2 + 통계(COUNT 겸용) + 목록
+        with django_assert_num_queries(6):
+            response = authenticated_client.get(URL_BUSINESS_LIST)
         assert len(response.context['page_obj']) == 20
         
         # 2페이지
-        response = authenticated_client.get(url, {'page': 2})
+        with django_assert_num_queries(6):
+            response = authenticated_client.get(URL_BUSINESS_LIST, {'page': 2})
         assert len(response.context['page_obj']) == 5
     
     def test_business_list_statistics(self, authenticated_client, user):
@@ -221,8 +235,7 @@ class TestBusinessListView:
         Business.objects.create(user=user, name='본점2', branch_type='main')
         Business.objects.create(user=user, name='지점1', branch_type='branch')
         
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_LIST)
         
         assert response.context['total_count'] == 3
         assert response.context['main_count'] == 2
@@ -230,10 +243,9 @@ class TestBusinessListView:
     
     def test_business_list_template_used(self, authenticated_client, business):
         """올바른 템플릿 사용 확인"""
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_LIST)
         
-        assert 'businesses/business_list.html' in [t.name for t in response.templates]
+        assertTemplateUsed(response, 'businesses/business_list.html')
 
 
 # =============================================================================
@@ -272,27 +284,24 @@ class TestBusinessDetailView:
         
         assert response.status_code == 404
     
-    def test_business_detail_shows_accounts(self, authenticated_client, business, user):
+    def test_business_detail_shows_accounts(self, authenticated_client, business, user, django_assert_num_queries):
         """연결된 계좌 목록 표시"""
-        # 이 사업장의 계좌 2개
-        account1 = Account.objects.create(
-            user=user, business=business,
-            name='계좌1', bank_name='은행', account_number='1111'
-        )
-        account2 = Account.objects.create(
-            user=user, business=business,
-            name='계좌2', bank_name='은행', account_number='2222'
-        )
-        
-        # 다른 사업장의 계좌
         other_business = Business.objects.create(user=user, name='다른사업장')
-        account3 = Account.objects.create(
-            user=user, business=other_business,
-            name='계좌3', bank_name='은행', account_number='3333'
-        )
+        
+        # 이 사업장의 계좌 2개 + 다른 사업장의 계좌 1개 (INSERT 1회)
+        account1, account2, account3 = Account.objects.bulk_create([
+            Account(user=user, business=business,
+                    name='계좌1', bank_name='은행', account_number='1111'),
+            Account(user=user, business=business,
+                    name='계좌2', bank_name='은행', account_number='2222'),
+            Account(user=user, business=other_business,
+                    name='계좌3', bank_name='은행', account_number='3333'),
+        ])
         
         url = reverse('businesses:business_detail', kwargs={'pk': business.pk})
-        response = authenticated_client.get(url)
+        # savepoint 2 + 세션/사용자 2 + 사업장 + 계좌 COUNT·SUM 1 + 거래 COUNT/수입/지출 3
+        with django_assert_num_queries(9):
+            response = authenticated_client.get(url)
         
         accounts = list(response.context['accounts'])
         assert account1 in accounts
@@ -304,19 +313,19 @@ class TestBusinessDetailView:
         Account.objects.create(
             user=user, business=business,
             name='계좌1', bank_name='은행', account_number='1111',
-            balance=Decimal('500000')
+            balance=D500K
         )
         Account.objects.create(
             user=user, business=business,
             name='계좌2', bank_name='은행', account_number='2222',
-            balance=Decimal('300000')
+            balance=D300K
         )
         
         url = reverse('businesses:business_detail', kwargs={'pk': business.pk})
         response = authenticated_client.get(url)
         
         assert response.context['account_count'] == 2
-        assert response.context['total_balance'] == Decimal('800000')
+        assert response.context['total_balance'] == D800K
 
 
 # =============================================================================
@@ -329,31 +338,22 @@ class TestBusinessCreateView:
     
     def test_business_create_get_requires_login(self, client):
         """로그인 필요 (GET)"""
-        url = reverse('businesses:business_create')
-        response = client.get(url)
+        response = client.get(URL_BUSINESS_CREATE)
         
         assert response.status_code == 302
     
     def test_business_create_get_success(self, authenticated_client):
         """사업장 생성 폼 표시"""
-        url = reverse('businesses:business_create')
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_CREATE)
         
         assert response.status_code == 200
         assert 'form' in response.context
     
     def test_business_create_post_success(self, authenticated_client):
         """사업장 생성 성공"""
-        url = reverse('businesses:business_create')
-        data = {
-            'name': '새 사업장',
-            'location': '서울시 강남구',
-            'business_type': '소매업',
-            'branch_type': 'main',
-            'registration_number': '123-45-67890',
-        }
+        data = {**VALID_BUSINESS_DATA}
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_BUSINESS_CREATE, data)
         
         assert response.status_code == 302
         assert Business.objects.filter(name='새 사업장').exists()
@@ -363,25 +363,23 @@ class TestBusinessCreateView:
     
     def test_business_create_minimal_data(self, authenticated_client):
         """최소 필수 필드만으로 생성"""
-        url = reverse('businesses:business_create')
         data = {
             'name': '최소사업장',
             'branch_type': 'main',
         }
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_BUSINESS_CREATE, data)
         
         assert response.status_code == 302
         assert Business.objects.filter(name='최소사업장').exists()
     
     def test_business_create_invalid_data(self, authenticated_client):
         """유효하지 않은 데이터로 생성 시도"""
-        url = reverse('businesses:business_create')
         data = {
             'name': '',  # 필수 필드 누락
         }
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_BUSINESS_CREATE, data)
         
         assert response.status_code == 200
         assert 'form' in response.context
@@ -389,40 +387,37 @@ class TestBusinessCreateView:
     
     def test_business_create_sets_user_automatically(self, authenticated_client, user):
         """사업장 생성 시 사용자 자동 설정"""
-        url = reverse('businesses:business_create')
         data = {
             'name': '새 사업장',
             'branch_type': 'main',
         }
         
-        authenticated_client.post(url, data)
+        authenticated_client.post(URL_BUSINESS_CREATE, data)
         
         business = Business.objects.get(name='새 사업장')
         assert business.user == user
     
     def test_business_create_duplicate_name(self, authenticated_client, business):
         """중복 사업장명 생성 시도"""
-        url = reverse('businesses:business_create')
         data = {
             'name': business.name,  # 중복
             'branch_type': 'branch',
         }
         
-        response = authenticated_client.post(url, data)
+        response = authenticated_client.post(URL_BUSINESS_CREATE, data)
         
         messages = list(get_messages(response.wsgi_request))
         assert any('이미 등록된' in str(m) or '실패' in str(m) for m in messages)
     
     def test_business_create_registration_number_normalization(self, authenticated_client):
         """사업자등록번호 자동 정규화"""
-        url = reverse('businesses:business_create')
         data = {
             'name': '테스트',
             'branch_type': 'main',
             'registration_number': '1234567890',  # 하이픈 없음
         }
         
-        authenticated_client.post(url, data)
+        authenticated_client.post(URL_BUSINESS_CREATE, data)
         
         business = Business.objects.get(name='테스트')
         assert business.registration_number == '123-45-67890'
@@ -459,12 +454,26 @@ class TestBusinessUpdateView:
         
         assert response.status_code == 302
         
-        business.refresh_from_db()
-        assert business.name == '수정된 사업장명'
+        assert Business.objects.filter(pk=business.pk, name='수정된 사업장명').exists()
         
         messages = list(get_messages(response.wsgi_request))
         assert any('수정되었습니다' in str(m) for m in messages)
     
+    def test_business_update_without_changes_skips_save(self, authenticated_client, business):
+        """변경 사항이 없으면 UPDATE 하지 않음 (updated_at 유지)"""
+        url = reverse('businesses:business_update', kwargs={'pk': business.pk})
+        data = {
+            'name': business.name,
+            'location': business.location,
+            'business_type': business.business_type,
+            'branch_type': business.branch_type,
+        }
+        
+        response = authenticated_client.post(url, data)
+        
+        assert response.status_code == 302
+        assert Business.objects.filter(pk=business.pk, updated_at=business.updated_at).exists()
+    
     def test_business_update_other_user_business_404(self, authenticated_client, other_user):
         """다른 사용자의 사업장 수정 시도"""
         other_business = Business.objects.create(
@@ -502,27 +511,36 @@ class TestBusinessDeleteView:
         
         assert response.status_code == 302
         
-        business.refresh_from_db()
-        assert business.is_active is False
+        assert Business.objects.filter(pk=business.pk, is_active=False).exists()
         
         messages = list(get_messages(response.wsgi_request))
         assert any('삭제되었습니다' in str(m) for m in messages)
     
     def test_business_delete_shows_account_count(self, authenticated_client, business, user):
         """연결된 계좌 수 표시"""
-        # 계좌 3개 생성
-        for i in range(3):
-            Account.objects.create(
+        # 계좌 3개 생성 (INSERT 1회)
+        Account.objects.bulk_create([
+            Account(
                 user=user, business=business,
                 name=f'계좌{i}', bank_name='은행',
                 account_number=f'{i}111'
             )
+            for i in range(3)
+        ])
         
         url = reverse('businesses:business_delete', kwargs={'pk': business.pk})
         response = authenticated_client.get(url)
         
         assert response.context['account_count'] == 3
     
+    def test_business_delete_disallowed_method_405(self, authenticated_client, business):
+        """GET/POST 외 메서드는 뷰 실행 전에 405"""
+        url = reverse('businesses:business_delete', kwargs={'pk': business.pk})
+        response = authenticated_client.put(url)
+        
+        assert response.status_code == 405
+        assert Business.objects.filter(pk=business.pk, is_active=True).exists()
+    
     def test_business_delete_other_user_business_404(self, authenticated_client, other_user):
         """다른 사용자의 사업장 삭제 시도"""
         other_business = Business.objects.create(
@@ -563,8 +581,7 @@ class TestBusinessRestoreView:
         
         assert response.status_code == 302
         
-        business.refresh_from_db()
-        assert business.is_active is True
+        assert Business.objects.filter(pk=business.pk, is_active=True).exists()
         
         messages = list(get_messages(response.wsgi_request))
         assert any('복구되었습니다' in str(m) for m in messages)
@@ -576,6 +593,16 @@ class TestBusinessRestoreView:
         
         messages = list(get_messages(response.wsgi_request))
         assert any('이미 활성' in str(m) for m in messages)
+    
+    def test_business_restore_other_user_404(self, authenticated_client, other_user):
+        """다른 사용자의 삭제된 사업장은 404"""
+        other_business = Business.objects.create(user=other_user, name='다른사업장', is_active=False)
+        
+        url = reverse('businesses:business_restore', kwargs={'pk': other_business.pk})
+        response = authenticated_client.post(url)
+        
+        assert response.status_code == 404
+        assert Business.objects.filter(pk=other_business.pk, is_active=False).exists()
 
 
 # =============================================================================
@@ -588,19 +615,19 @@ class TestBusinessDeletedListView:
     
     def test_business_deleted_list_requires_login(self, client):
         """로그인 필요"""
-        url = reverse('businesses:business_deleted_list')
-        response = client.get(url)
+        response = client.get(URL_BUSINESS_DELETED_LIST)
         
         assert response.status_code == 302
     
-    def test_business_deleted_list_shows_only_deleted(self, authenticated_client, user):
+    def test_business_deleted_list_shows_only_deleted(self, authenticated_client, user, django_assert_num_queries):
         """삭제된 사업장만 표시"""
         active = Business.objects.create(user=user, name='활성')
         deleted = Business.objects.create(user=user, name='삭제됨')
         deleted.soft_delete()
         
-        url = reverse('businesses:business_deleted_list')
-        response = authenticated_client.get(url)
+        # savepoint 2 + 세션/사용자 2 + 목록 (커서 페이지네이션이라 COUNT 없음)
+        with django_assert_num_queries(5):
+            response = authenticated_client.get(URL_BUSINESS_DELETED_LIST)
         
         businesses = list(response.context['page_obj'])
         assert deleted in businesses
@@ -608,20 +635,100 @@ class TestBusinessDeletedListView:
     
     def test_business_deleted_list_pagination(self, authenticated_client, user):
         """페이지네이션 테스트"""
-        # 삭제된 사업장 25개 생성
-        for i in range(25):
-            business = Business.objects.create(user=user, name=f'사업장{i}')
-            business.soft_delete()
+        # 삭제된 사업장 25개 생성 (INSERT 1회)
+        Business.objects.bulk_create([
+            Business(user=user, name=f'사업장{i}', is_active=False)
+            for i in range(25)
+        ])
         
-        url = reverse('businesses:business_deleted_list')
         
         # 1페이지
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(URL_BUSINESS_DELETED_LIST)
         assert len(response.context['page_obj']) == 20
+        next_cursor = response.context['next_cursor']
+        assert next_cursor
         
-        # 2페이지
-        response = authenticated_client.get(url, {'page': 2})
+        # 2페이지 (커서)
+        response = authenticated_client.get(URL_BUSINESS_DELETED_LIST, {'cursor': next_cursor})
         assert len(response.context['page_obj']) == 5
+        assert response.context['next_cursor'] is None
+    
+    def test_business_deleted_list_cursor_pages_do_not_overlap(self, authenticated_client, user):
+        """커서 페이지 간 중복/누락 없음 (updated_at 동률은 id로 구분)"""
+        Business.objects.bulk_create([
+            Business(user=user, name=f'사업장{i}', is_active=False)
+            for i in range(25)
+        ])
+        # 모든 행의 updated_at을 같게 만들어 id 보조 정렬을 검증
+        Business.objects.filter(user=user).update(updated_at=timezone.now())
+        
+        first = authenticated_client.get(URL_BUSINESS_DELETED_LIST)
+        second = authenticated_client.get(URL_BUSINESS_DELETED_LIST, {'cursor': first.context['next_cursor']})
+        
+        pks = [b.pk for b in first.context['page_obj']] + [b.pk for b in second.context['page_obj']]
+        assert len(set(pks)) == 25
+    
+    def test_business_deleted_list_invalid_cursor(self, authenticated_client, user):
+        """잘못된 커서는 첫 페이지로 폴백"""
+        deleted = Business.objects.create(user=user, name='삭제됨')
+        deleted.soft_delete()
+        
+        response = authenticated_client.get(URL_BUSINESS_DELETED_LIST, {'cursor': 'invalid'})
+        
+        assert response.status_code == 200
+        assert deleted in response.context['page_obj']
+    
+    def test_business_deleted_export_requires_login(self, client):
+        """CSV 내보내기도 로그인 필요"""
+        response = client.get(URL_BUSINESS_DELETED_EXPORT)
+        
+        assert response.status_code == 302
+    
+    def test_business_deleted_export_streams_only_deleted(self, authenticated_client, user):
+        """삭제된 본인 사업장만 CSV로 스트리밍"""
+        Business.objects.bulk_create([
+            Business(user=user, name='활성', is_active=True),
+            Business(user=user, name='삭제됨', is_active=False),
+        ])
+        
+        response = authenticated_client.get(URL_BUSINESS_DELETED_EXPORT)
+        
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'].startswith('text/csv')
+        body = b''.join(response.streaming_content).decode('utf-8')
+        assert '삭제됨' in body
+        assert '활성' not in body
+    
+    def test_business_deleted_export_escapes_formula_cells(self, authenticated_client, user):
+        """수식으로 시작하는 사용자 입력은 '를 붙여 문자열로 내보냄"""
+        Business.objects.bulk_create([
+            Business(user=user, name='=HYPERLINK("http://x")', location='@SUM(A1)', is_active=False),
+        ])
+        
+        response = authenticated_client.get(URL_BUSINESS_DELETED_EXPORT)
+        
+        body = b''.join(response.streaming_content).decode('utf-8')
+        assert '"\'=HYPERLINK(""http://x"")"' in body
+        assert "'@SUM(A1)" in body
+    
+    def test_business_deleted_export_uses_local_time(self, authenticated_client, user):
+        """삭제일시는 UTC가 아닌 현지 시간(Asia/Seoul)으로 기록"""
+        deleted = Business.objects.create(user=user, name='삭제됨', is_active=False)
+        Business.objects.filter(pk=deleted.pk).update(
+            updated_at=datetime(2024, 1, 1, 15, 30, tzinfo=dt_timezone.utc)
+        )
+        
+        response = authenticated_client.get(URL_BUSINESS_DELETED_EXPORT)
+        
+        body = b''.join(response.streaming_content).decode('utf-8')
+        assert '2024-01-02 00:30' in body
+    
+    def test_business_deleted_export_post_405(self, authenticated_client):
+        """CSV 내보내기는 GET만 허용"""
+        response = authenticated_client.post(URL_BUSINESS_DELETED_EXPORT)
+        
+        assert response.status_code == 405
 
 
 # =============================================================================
@@ -634,16 +741,21 @@ class TestHelperFunctions:
     
     def test_pagination_first_page(self, authenticated_client, multiple_businesses):
         """첫 페이지 조회"""
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'page': 1})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'page': 1})
         
         assert response.status_code == 200
         assert len(response.context['page_obj']) == 20
     
+    def test_pagination_second_page_keeps_ordering(self, authenticated_client, multiple_businesses):
+        """PK 서브쿼리 페이지네이션 후에도 정렬 순서 유지"""
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'page': 2})
+        
+        names = [b.name for b in response.context['page_obj']]
+        assert names == [f'사업장{i:02d}' for i in range(20, 25)]
+    
     def test_pagination_invalid_page_number(self, authenticated_client, multiple_businesses):
         """잘못된 페이지 번호 (문자열)"""
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'page': 'invalid'})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'page': 'invalid'})
         
         # 1페이지로 폴백
         assert response.status_code == 200
@@ -651,16 +763,14 @@ class TestHelperFunctions:
     
     def test_pagination_negative_page_number(self, authenticated_client, multiple_businesses):
         """음수 페이지 번호"""
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'page': -1})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'page': -1})
         
         # 1페이지로 폴백
         assert response.status_code == 200
     
     def test_pagination_too_large_page_number(self, authenticated_client, multiple_businesses):
         """존재하지 않는 큰 페이지 번호"""
-        url = reverse('businesses:business_list')
-        response = authenticated_client.get(url, {'page': 9999})
+        response = authenticated_client.get(URL_BUSINESS_LIST, {'page': 9999})
         
         # 마지막 페이지로 폴백
         assert response.status_code == 200
@@ -20,6 +20,7 @@ urlpatterns = [
 # 1. 특수 목적의 주소 (글자로 된 것들)를 먼저 배치
     path('', views.business_list, name='business_list'),
     path('deleted/', views.business_deleted_list, name='business_deleted_list'),
+    path('deleted/export/', views.business_deleted_export, name='business_deleted_export'),
     path('create/', views.business_create, name='business_create'),
 
     # 2. 통계 페이지 (통계도 ID가 필요하므로 상세 페이지 바로 근처에)
@@ -1,12 +1,17 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.http import require_GET, require_http_methods
 from django.contrib import messages
-from django.db.models import Q, Sum, Count
+from django.http import Http404, StreamingHttpResponse
+from django.db.models import Q, Sum, Count, QuerySet
+from django.db.models.functions import Coalesce
 from django.core.paginator import Paginator
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.utils import timezone
+from datetime import datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal
+import csv
 import logging
 
 from .models import Account, Business
@@ -19,7 +24,32 @@ logger = logging.getLogger(__name__)
 # Helper 함수
 # =============================================================================
 
-def _get_optimized_page(queryset, page_number, per_page=20):
+class _PKSubqueryPaginator(Paginator):
+    """
+    PK 서브쿼리로 페이지를 자르는 Paginator
+
+    기본 Paginator는 전체 컬럼을 SELECT 한 뒤 OFFSET/LIMIT 하므로 뒤쪽 페이지일수록
+    버려질 넓은 행을 DB가 계속 읽습니다. 여기서는 OFFSET/LIMIT을 pk만 고르는
+    서브쿼리 안에서 수행하고, 바깥 쿼리는 해당 pk 20개만 전체 컬럼으로 가져옵니다.
+
+        SELECT ... WHERE id IN (SELECT id ... ORDER BY ... LIMIT 20 OFFSET n) ORDER BY ...
+    """
+
+    def page(self, number):
+        if not isinstance(self.object_list, QuerySet):
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        page_pks = self.object_list.values('pk')[bottom:top]
+        return self._get_page(self.object_list.filter(pk__in=page_pks), number, self)
+
+
+def _get_optimized_page(queryset, page_number, per_page=20, count=None):
     """
     최적화된 페이지네이션 헬퍼 함수
     
@@ -27,11 +57,17 @@ def _get_optimized_page(queryset, page_number, per_page=20):
         queryset: 페이지네이션할 QuerySet
         page_number: 페이지 번호
         per_page: 페이지당 항목 수 (기본 20)
+        count: 이미 알고 있는 queryset의 전체 개수 (선택)
+               반드시 queryset.count()와 같은 값이어야 하며,
+               주어지면 Paginator가 COUNT(*) 쿼리를 다시 실행하지 않습니다.
     
     Returns:
         Page 객체
     """
-    paginator = Paginator(queryset, per_page)
+    paginator = _PKSubqueryPaginator(queryset, per_page)
+    if count is not None:
+        # Paginator.count는 cached_property → 미리 채워두면 COUNT(*) 생략
+        paginator.count = count
     
     # 페이지 번호 검증
     try:
@@ -46,6 +82,56 @@ def _get_optimized_page(queryset, page_number, per_page=20):
     return paginator.get_page(page_num)
 
 
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _encode_cursor(obj, field='updated_at'):
+    """(field 시각, pk) → URL에 그대로 쓸 수 있는 '마이크로초-pk' 토큰"""
+    micros = (getattr(obj, field) - _CURSOR_EPOCH) // timedelta(microseconds=1)
+    return f'{micros}-{obj.pk}'
+
+
+def _decode_cursor(cursor):
+    """'마이크로초-pk' 토큰 → (시각, pk), 형식이 잘못되면 None"""
+    try:
+        micros, pk = cursor.split('-')
+        return _CURSOR_EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+
+def _get_cursor_page(queryset, cursor, per_page=20, field='updated_at'):
+    """
+    커서(keyset) 기반 페이지네이션 헬퍼 함수
+    
+    (field, id) 내림차순으로 정렬하고, 이전 페이지 마지막 행보다 뒤에 있는
+    행만 per_page + 1개 가져옵니다. COUNT(*)와 OFFSET이 없으므로 목록이 길어져도
+    다음 페이지 비용은 per_page에 비례합니다.
+    
+    Args:
+        queryset: 페이지네이션할 QuerySet (field 필드 필요)
+        cursor: 이전 페이지가 돌려준 next_cursor (첫 페이지는 None)
+        per_page: 페이지당 항목 수 (기본 20)
+        field: 정렬 기준 DateTimeField 이름 (기본 updated_at)
+    
+    Returns:
+        (items, next_cursor) - 마지막 페이지면 next_cursor는 None
+    """
+    queryset = queryset.order_by(f'-{field}', '-id')
+    
+    # 잘못된 커서는 첫 페이지로 폴백
+    position = _decode_cursor(cursor) if cursor else None
+    if position:
+        value, pk = position
+        queryset = queryset.filter(
+            Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk})
+        )
+    
+    items = list(queryset[:per_page + 1])
+    next_cursor = _encode_cursor(items[per_page - 1], field) if len(items) > per_page else None
+    return items[:per_page], next_cursor
+
+
 # =============================================================================
 # Account 뷰
 # =============================================================================
@@ -65,50 +151,59 @@ def account_list(request):
     # 기본 쿼리셋: 본인의 활성 계좌만
     accounts = Account.active.filter(user=user).select_related('business')
     
-    # 검색 폼
-    search_form = AccountSearchForm(request.GET, user=user)
+    # 검색 폼 (쿼리스트링이 없으면 unbound → 검증/필터 분기 전체 생략)
+    search_form = AccountSearchForm(request.GET or None, user=user)
+    
+    # 조건을 모아 filter()를 한 번만 호출 (QuerySet 복제 최소화)
+    filters = {}
+    search_q = Q()
     
     if search_form.is_valid():
         # 계좌 타입 필터
         account_type = search_form.cleaned_data.get('account_type')
         if account_type:
-            accounts = accounts.filter(account_type=account_type)
+            filters['account_type'] = account_type
         
         # 사업장 필터
         business = search_form.cleaned_data.get('business')
         if business:
-            accounts = accounts.filter(business=business)
+            filters['business'] = business
         
-        # 검색어 필터 (계좌명 또는 은행명)
+        # 검색어 필터 (계좌명 또는 은행명, trigram GIN 인덱스 사용)
         search = search_form.cleaned_data.get('search')
         if search:
-            accounts = accounts.filter(
-                Q(name__icontains=search) | Q(bank_name__icontains=search)
-            )
+            search_q = Q(name__icontains=search) | Q(bank_name__icontains=search)
     
-    # 정렬: 최신순
-    accounts = accounts.order_by('-created_at')
+    if filters or search_q:
+        accounts = accounts.filter(search_q, **filters)
     
-    # 페이지네이션 (헬퍼 함수 사용)
-    page_obj = _get_optimized_page(accounts, request.GET.get('page'))
+    # 목록 테이블에 표시하는 컬럼만 SELECT (정렬은 커서 페이지네이션에서)
+    accounts = accounts.only(
+        'id', 'name', 'bank_name', 'account_number', 'account_type',
+        'balance', 'created_at', 'business', 'business__name',
+    )
     
-
-
-    # 요약 정보 
-    total_count = Account.active.filter(user=user).count()
-    business_count = Account.active.filter(user=user, account_type='business').count()
-    personal_count = Account.active.filter(user=user, account_type='personal').count()
-    total_balance = Account.active.filter(user=user).aggregate(
-        total=Sum('balance')
-    )['total'] or Decimal('0.00')
+    # 요약 정보 (1번 쿼리)
+    summary = Account.active.filter(user=user).aggregate(
+        total_count=Count('id'),
+        business_count=Count('id', filter=Q(account_type='business')),
+        personal_count=Count('id', filter=Q(account_type='personal')),
+        total_balance=Coalesce(Sum('balance'), Decimal('0.00')),
+    )
+    
+    # 커서 페이지네이션: 최신순 (created_at, id), OFFSET 없음
+    cursor = request.GET.get('cursor')
+    page_obj, next_cursor = _get_cursor_page(accounts, cursor, field='created_at')
     
     context = {
         'page_obj': page_obj,
+        'next_cursor': next_cursor,
+        'is_first_page': not cursor,
         'search_form': search_form,
-        'total_count': total_count,
-        'business_count': business_count,
-        'personal_count': personal_count,
-        'total_balance': total_balance,
+        'total_count': summary['total_count'],
+        'business_count': summary['business_count'],
+        'personal_count': summary['personal_count'],
+        'total_balance': summary['total_balance'],
     }
     
     return render(request, 'businesses/account_list.html', context)
@@ -128,7 +223,8 @@ def account_deleted_list(request):
     
     context = {
         'page_obj': page_obj,
-        'deleted_count': deleted_accounts.count(),
+        # Paginator가 이미 계산한 COUNT(*)를 재사용
+        'deleted_count': page_obj.paginator.count,
     }
     return render(request, 'businesses/account_deleted_list.html', context)
 
@@ -151,26 +247,21 @@ def account_detail(request, pk):
     now = timezone.now()
     
     # 최근 거래 내역 5건
+    # 정렬을 tx_active_recent 부분 인덱스(account, -occurred_at, -id WHERE is_active)와 맞춰
+    # 전체 활성 거래를 정렬하지 않고 인덱스 앞쪽 5건만 읽도록 함
     recent_transactions = account.transactions.filter(
         is_active=True,
         occurred_at__lte=now
     ).select_related('category', 'merchant').order_by('-occurred_at', '-id')[:5]
 
-        # 통계 계산
+    # 통계 계산 (1번 쿼리, 거래가 없어도 Coalesce로 0 보장)
     stats = account.transactions.filter(is_active=True).aggregate(
         total_count=Count('id'),
         income_count=Count('id', filter=Q(tx_type='IN')),
         expense_count=Count('id', filter=Q(tx_type='OUT')),
-        total_income=Sum('amount', filter=Q(tx_type='IN')),
-        total_expense=Sum('amount', filter=Q(tx_type='OUT'))
+        total_income=Coalesce(Sum('amount', filter=Q(tx_type='IN')), Decimal('0.00')),
+        total_expense=Coalesce(Sum('amount', filter=Q(tx_type='OUT')), Decimal('0.00')),
     )
-
-    # None 값 처리
-    stats['total_count'] = stats['total_count'] or 0
-    stats['income_count'] = stats['income_count'] or 0
-    stats['expense_count'] = stats['expense_count'] or 0
-    stats['total_income'] = stats['total_income'] or 0
-    stats['total_expense'] = stats['total_expense'] or 0
     stats['net_amount'] = stats['total_income'] - stats['total_expense']
     
     context = {
@@ -182,6 +273,7 @@ def account_detail(request, pk):
     return render(request, 'businesses/account_detail.html', context)
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def account_create(request):
     """
@@ -209,15 +301,15 @@ def account_create(request):
                 return redirect('businesses:account_detail', pk=account.pk)
                 
             except IntegrityError as e:
-                logger.error(f"계좌 생성 실패 (무결성 제약): user_id={request.user.id}, error={e}")
+                logger.error("계좌 생성 실패 (무결성 제약): user_id=%s, error=%s", request.user.id, e)
                 messages.error(request, '이미 등록된 계좌입니다.')
                 
             except ValidationError as e:
-                logger.warning(f"계좌 검증 실패: user_id={request.user.id}, error={e}")
+                logger.warning("계좌 검증 실패: user_id=%s, error=%s", request.user.id, e)
                 messages.error(request, '입력 형식이 올바르지 않습니다.')
                 
             except Exception as e:
-                logger.error(f"계좌 생성 중 예상치 못한 오류: user_id={request.user.id}, error={e}", exc_info=True)
+                logger.error("계좌 생성 중 예상치 못한 오류: user_id=%s, error=%s", request.user.id, e, exc_info=True)
                 messages.error(request, '계좌 생성 중 오류가 발생했습니다. 관리자에게 문의해주세요.')
         else:
             messages.error(request, '계좌 생성에 실패했습니다. 입력 내용을 확인해주세요.')
@@ -233,6 +325,7 @@ def account_create(request):
     return render(request, 'businesses/account_form.html', context)
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def account_update(request, pk):
     """
@@ -256,15 +349,15 @@ def account_update(request, pk):
                 return redirect('businesses:account_detail', pk=account.pk)
                 
             except IntegrityError as e:
-                logger.error(f"계좌 수정 실패 (무결성 제약): account_id={account.pk}, error={e}")
+                logger.error("계좌 수정 실패 (무결성 제약): account_id=%s, error=%s", account.pk, e)
                 messages.error(request, '이미 등록된 계좌입니다.')
                 
             except ValidationError as e:
-                logger.warning(f"계좌 검증 실패: account_id={account.pk}, error={e}")
+                logger.warning("계좌 검증 실패: account_id=%s, error=%s", account.pk, e)
                 messages.error(request, '입력 형식이 올바르지 않습니다.')
                 
             except Exception as e:
-                logger.error(f"계좌 수정 중 예상치 못한 오류: account_id={account.pk}, error={e}", exc_info=True)
+                logger.error("계좌 수정 중 예상치 못한 오류: account_id=%s, error=%s", account.pk, e, exc_info=True)
                 messages.error(request, '계좌 수정 중 오류가 발생했습니다. 관리자에게 문의해주세요.')
         else:
             messages.error(request, '계좌 수정에 실패했습니다. 입력 내용을 확인해주세요.')
@@ -281,6 +374,7 @@ def account_update(request, pk):
     return render(request, 'businesses/account_form.html', context)
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def account_delete(request, pk):
     """
@@ -290,7 +384,13 @@ def account_delete(request, pk):
     - 확인 페이지 표시
     - 실제로는 is_active=False로 설정
     """
-    account = get_object_or_404(Account.active, pk=pk, user=request.user)
+    queryset = Account.active
+    if request.method != 'POST':
+        # 확인 페이지: 연결된 거래 수를 계좌 조회와 같은 쿼리에서 함께 계산
+        queryset = queryset.annotate(
+            transaction_count=Count('transactions', filter=Q(transactions__is_active=True))
+        )
+    account = get_object_or_404(queryset, pk=pk, user=request.user)
     
     if request.method == 'POST':
         account_name = account.name
@@ -301,17 +401,15 @@ def account_delete(request, pk):
         messages.success(request, f'계좌 "{account_name}"가 삭제되었습니다.')
         return redirect('businesses:account_list')
     
-    # 연결된 거래 수 확인
-    transaction_count = account.transactions.filter(is_active=True).count()
-    
     context = {
         'account': account,
-        'transaction_count': transaction_count,
+        'transaction_count': account.transaction_count,
     }
     
     return render(request, 'businesses/account_confirm_delete.html', context)
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def account_hard_delete(request, pk):
     # 계좌 영구삭제 모드
@@ -326,6 +424,7 @@ def account_hard_delete(request, pk):
     return render(request, 'businesses/account_confirm_hard_delete.html', {'account': account})
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def account_restore(request, pk):
     """
@@ -334,12 +433,15 @@ def account_restore(request, pk):
     - 삭제된 계좌만 복구 가능
     - POST 요청만 허용
     """
-    # 삭제된 계좌 조회 (objects 사용)
-    account = get_object_or_404(Account.objects, pk=pk, user=request.user)
+    # 삭제된 계좌만 조회 (is_active=False 조건을 쿼리에 포함)
+    account = Account.objects.filter(pk=pk, user=request.user, is_active=False).first()
     
-    if account.is_active:
-        messages.warning(request, '이미 활성 상태인 계좌입니다.')
-        return redirect('businesses:account_detail', pk=pk)
+    if account is None:
+        # 삭제된 계좌가 없을 때만 활성 계좌인지 확인 (아니면 404)
+        if Account.active.filter(pk=pk, user=request.user).exists():
+            messages.warning(request, '이미 활성 상태인 계좌입니다.')
+            return redirect('businesses:account_detail', pk=pk)
+        raise Http404('계좌를 찾을 수 없습니다.')
     
     if request.method == 'POST':
         account.restore()
@@ -371,36 +473,44 @@ def account_summary(request):
     """
     user = request.user
     
-    # 기본 통계
+    # 기본 통계 (1번 쿼리)
     accounts = Account.active.filter(user=user)
-    total_count = accounts.count()
-    business_count = accounts.filter(account_type='business').count()
-    personal_count = accounts.filter(account_type='personal').count()
-    total_balance = accounts.aggregate(total=Sum('balance'))['total'] or Decimal('0.00')
+    summary = accounts.aggregate(
+        total_count=Count('id'),
+        business_count=Count('id', filter=Q(account_type='business')),
+        personal_count=Count('id', filter=Q(account_type='personal')),
+        total_balance=Coalesce(Sum('balance'), Decimal('0.00')),
+    )
+    
+    # 아래 3개 집계는 서로 독립적이지만 순차 실행합니다.
+    # async 뷰 + asyncio.gather는 ATOMIC_REQUESTS 설정과 함께 쓸 수 없고
+    # (RuntimeError), async ORM도 결국 한 스레드에서 쿼리를 직렬 실행합니다.
+    
+    # 아래 목록은 템플릿의 {% if %}와 {% for %}가 함께 쓰므로 list()로 한 번만 평가
     
     # 사업장별 계좌 현황
-    business_accounts = accounts.filter(business__isnull=False).values(
+    business_accounts = list(accounts.filter(business__isnull=False).values(
         'business__id', 'business__name'
     ).annotate(
         count=Count('id'),
         total_balance=Sum('balance')
-    ).order_by('-total_balance')
+    ).order_by('-total_balance'))
     
     # 잔액 부족 계좌 (10만원 미만)
     threshold = Decimal('100000')
-    low_balance_accounts = accounts.filter(balance__lt=threshold).order_by('balance')[:5]
+    low_balance_accounts = list(accounts.filter(balance__lt=threshold).order_by('balance')[:5])
     
     # 은행별 계좌 현황
-    bank_accounts = accounts.values('bank_name').annotate(
+    bank_accounts = list(accounts.values('bank_name').annotate(
         count=Count('id'),
         total_balance=Sum('balance')
-    ).order_by('-count')[:5]
+    ).order_by('-count')[:5])
     
     context = {
-        'total_count': total_count,
-        'business_count': business_count,
-        'personal_count': personal_count,
-        'total_balance': total_balance,
+        'total_count': summary['total_count'],
+        'business_count': summary['business_count'],
+        'personal_count': summary['personal_count'],
+        'total_balance': summary['total_balance'],
         'business_accounts': business_accounts,
         'low_balance_accounts': low_balance_accounts,
         'low_balance_threshold': threshold,
@@ -431,30 +541,33 @@ def business_list(request):
     
     # 검색 폼
     search_form = BusinessSearchForm(request.GET)
+    is_filtered = False
     
     if search_form.is_valid():
         # 구분 필터 (본점/지점)
         branch_type = search_form.cleaned_data.get('branch_type')
         if branch_type:
             businesses = businesses.filter(branch_type=branch_type)
+            is_filtered = True
         
         # 업종 필터
         business_type = search_form.cleaned_data.get('business_type')
         if business_type:
             businesses = businesses.filter(business_type__icontains=business_type)
+            is_filtered = True
         
-        # 검색어 필터 (사업장명 또는 위치)
+        # 검색어 필터 (사업장명 또는 위치, trigram GIN 인덱스 사용)
         search = search_form.cleaned_data.get('search')
         if search:
             businesses = businesses.filter(
                 Q(name__icontains=search) | Q(location__icontains=search)
             )
+            is_filtered = True
     
-    # 정렬: 이름순
-    businesses = businesses.order_by('name')
-    
-    # 페이지네이션 (헬퍼 함수 사용)
-    page_obj = _get_optimized_page(businesses, request.GET.get('page'))
+    # 정렬: 이름순 (목록 카드에 표시하는 컬럼만 SELECT)
+    businesses = businesses.order_by('name').only(
+        'id', 'name', 'location', 'business_type', 'branch_type'
+    )
     
     # 통계 계산 최적화 (1번 쿼리)
     stats = Business.active.filter(user=user).aggregate(
@@ -463,14 +576,20 @@ def business_list(request):
         branch_count=Count('id', filter=Q(branch_type='branch'))
     )
     
+    # 페이지네이션 (헬퍼 함수 사용)
+    # 필터가 없으면 목록 개수 == total_count 이므로 COUNT(*)를 재사용
+    page_obj = _get_optimized_page(
+        businesses,
+        request.GET.get('page'),
+        count=None if is_filtered else stats['total_count'],
+    )
+    
     total_count = stats['total_count']
     main_count = stats['main_count']
     branch_count = stats['branch_count']
     
     context = {
-        'businesses': businesses,
         'page_obj': page_obj,
-        'businesses': businesses,
         'search_form': search_form,
         'total_count': total_count,
         'main_count': main_count,
@@ -487,18 +606,81 @@ def business_deleted_list(request):
     deleted_businesses = Business.objects.filter(
         user=user,
         is_active=False
-    ).order_by('-updated_at')
+    ).only(
+        'id', 'name', 'location', 'business_type', 'branch_type', 'updated_at'
+    )
     
-    # 페이지네이션 (헬퍼 함수 사용)
-    page_obj = _get_optimized_page(deleted_businesses, request.GET.get('page'))
+    # 커서 페이지네이션 (COUNT(*) 없음)
+    cursor = request.GET.get('cursor')
+    page_obj, next_cursor = _get_cursor_page(deleted_businesses, cursor)
     
     context = {
         'page_obj': page_obj,
-        'deleted_count': deleted_businesses.count(),
+        'next_cursor': next_cursor,
+        'is_first_page': not cursor,
     }
     return render(request, 'businesses/business_deleted_list.html', context)
 
 
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 가짜 파일 객체"""
+
+    def write(self, value):
+        return value
+
+
+# 엑셀이 수식으로 해석하는 셀 시작 문자 (CSV 수식 주입 방지)
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_safe(value):
+    """사용자 입력 문자열이 수식으로 실행되지 않도록 앞에 '를 붙임"""
+    if value and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+@require_GET
+@login_required
+def business_deleted_export(request):
+    """
+    삭제된 사업장 CSV 내보내기
+
+    - 전체 목록을 메모리에 올리지 않고 iterator(chunk_size=500)로 흘려보냄
+    - PostgreSQL에서는 서버 사이드 커서를 사용하므로 메모리는 행 수와 무관하게 일정
+    - 사용자 입력 칸은 수식 주입 방지 처리, 삭제일시는 현지 시간(TIME_ZONE)
+    """
+    deleted_businesses = Business.objects.filter(
+        user=request.user,
+        is_active=False
+    ).order_by('-updated_at', '-id').values_list(
+        'id', 'name', 'location', 'business_type', 'branch_type', 'updated_at'
+    )
+
+    writer = csv.writer(_Echo())
+
+    def rows():
+        # 엑셀에서 한글이 깨지지 않도록 BOM 먼저 전송
+        yield '\ufeff'
+        yield writer.writerow(['ID', '사업장명', '위치', '업종', '구분', '삭제일시'])
+        for row in deleted_businesses.iterator(chunk_size=500):
+            pk, name, location, business_type, branch_type, updated_at = row
+            yield writer.writerow([
+                pk,
+                _csv_safe(name),
+                _csv_safe(location),
+                _csv_safe(business_type),
+                branch_type,
+                # DB의 UTC 시각을 TIME_ZONE(Asia/Seoul) 기준으로 변환
+                timezone.localtime(updated_at).strftime('%Y-%m-%d %H:%M'),
+            ])
+
+    response = StreamingHttpResponse(rows(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = 'attachment; filename="deleted_businesses.csv"'
+    return response
+
+
+@require_http_methods(['GET', 'POST'])
 @login_required
 def business_create(request):
     """
@@ -526,15 +708,15 @@ def business_create(request):
                 return redirect('businesses:business_detail', pk=business.pk)
                 
             except IntegrityError as e:
-                logger.error(f"사업장 생성 실패 (무결성 제약): user_id={request.user.id}, error={e}")
+                logger.error("사업장 생성 실패 (무결성 제약): user_id=%s, error=%s", request.user.id, e)
                 messages.error(request, '이미 등록된 사업장명입니다.')
                 
             except ValidationError as e:
-                logger.warning(f"사업장 검증 실패: user_id={request.user.id}, error={e}")
+                logger.warning("사업장 검증 실패: user_id=%s, error=%s", request.user.id, e)
                 messages.error(request, '입력 형식이 올바르지 않습니다.')
                 
             except Exception as e:
-                logger.error(f"사업장 생성 중 예상치 못한 오류: user_id={request.user.id}, error={e}", exc_info=True)
+                logger.error("사업장 생성 중 예상치 못한 오류: user_id=%s, error=%s", request.user.id, e, exc_info=True)
                 messages.error(request, '사업장 생성 중 오류가 발생했습니다. 관리자에게 문의해주세요.')
         else:
             messages.error(request, '사업장 생성에 실패했습니다. 입력 내용을 확인해주세요.')
@@ -570,15 +752,17 @@ def business_detail(request, pk):
         is_active=True
     ).select_related('business').order_by('-created_at')
     
-    # 통계
-    account_count = accounts.count()
-    total_balance = accounts.aggregate(total=Sum('balance'))['total'] or Decimal('0.00')
+    # 통계 (계좌 수 + 잔액 합계를 1번 쿼리로)
+    summary = accounts.aggregate(
+        account_count=Count('id'),
+        total_balance=Coalesce(Sum('balance'), Decimal('0.00')),
+    )
     
     context = {
         'business': business,
         'accounts': accounts,
-        'account_count': account_count,
-        'total_balance': total_balance,
+        'account_count': summary['account_count'],
+        'total_balance': summary['total_balance'],
     }
     
     return render(request, 'businesses/business_detail.html', context)
@@ -630,14 +814,14 @@ def business_statistics(request, pk):
         year = 'all'
         month = 'all'
 
-    # 3. 데이터 집계 (카테고리별)
-    stats = transactions.values('category__name').annotate(
+    # 3. 데이터 집계 (카테고리별, GROUP BY 1번 쿼리를 리스트로 한 번만 평가)
+    stats = list(transactions.values('category__name').annotate(
         total_amount=Sum('amount'),
         count=Count('id')
-    ).order_by('-total_amount')
+    ).order_by('-total_amount'))
 
-    # 총액 계산
-    total_sum = transactions.aggregate(Sum('amount'))['amount__sum'] or 0
+    # 총액 = 카테고리별 합계의 합 (같은 거래 집합을 다시 스캔하지 않음)
+    total_sum = sum(s['total_amount'] for s in stats)
 
     # 비중(%) 계산
     for s in stats:
@@ -655,7 +839,7 @@ def business_statistics(request, pk):
         'business': business,
         'stats': stats,
         'total_sum': total_sum,
-        'category_count': stats.count(),
+        'category_count': len(stats),
         'available_years': available_years,
         'selected_year': year,
         'selected_month': month,
@@ -666,6 +850,7 @@ def business_statistics(request, pk):
     
     return render(request, 'businesses/business_statistics.html', context)
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def business_update(request, pk):
     """
@@ -681,7 +866,10 @@ def business_update(request, pk):
         
         if form.is_valid():
             try:
-                form.save()
+                # 변경된 컬럼만 UPDATE (변경이 없으면 쿼리 생략)
+                business = form.save(commit=False)
+                if form.changed_data:
+                    business.save(update_fields=[*form.changed_data, 'updated_at'])
                 
                 logger.info(f"사업장 수정: {business.name} (ID: {business.pk})")
                 
@@ -689,15 +877,15 @@ def business_update(request, pk):
                 return redirect('businesses:business_detail', pk=business.pk)
                 
             except IntegrityError as e:
-                logger.error(f"사업장 수정 실패 (무결성 제약): business_id={business.pk}, error={e}")
+                logger.error("사업장 수정 실패 (무결성 제약): business_id=%s, error=%s", business.pk, e)
                 messages.error(request, '이미 등록된 사업장명입니다.')
                 
             except ValidationError as e:
-                logger.warning(f"사업장 검증 실패: business_id={business.pk}, error={e}")
+                logger.warning("사업장 검증 실패: business_id=%s, error=%s", business.pk, e)
                 messages.error(request, '입력 형식이 올바르지 않습니다.')
                 
             except Exception as e:
-                logger.error(f"사업장 수정 중 예상치 못한 오류: business_id={business.pk}, error={e}", exc_info=True)
+                logger.error("사업장 수정 중 예상치 못한 오류: business_id=%s, error=%s", business.pk, e, exc_info=True)
                 messages.error(request, '사업장 수정 중 오류가 발생했습니다. 관리자에게 문의해주세요.')
         else:
             messages.error(request, '사업장 수정에 실패했습니다. 입력 내용을 확인해주세요.')
@@ -714,6 +902,7 @@ def business_update(request, pk):
     return render(request, 'businesses/business_form.html', context)
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def business_delete(request, pk):
     """
@@ -744,6 +933,7 @@ def business_delete(request, pk):
     return render(request, 'businesses/business_confirm_delete.html', context)
 
 
+@require_http_methods(['GET', 'POST'])
 @login_required
 def business_restore(request, pk):
     """
@@ -752,12 +942,15 @@ def business_restore(request, pk):
     - 삭제된 사업장만 복구 가능
     - POST 요청만 허용
     """
-    # 삭제된 사업장 조회 (objects 사용)
-    business = get_object_or_404(Business.objects, pk=pk, user=request.user)
-    
-    if business.is_active:
-        messages.warning(request, '이미 활성 상태인 사업장입니다.')
-        return redirect('businesses:business_detail', pk=pk)
+    # 삭제된 사업장만 조회 (is_active=False 조건을 쿼리에 포함)
+    business = Business.objects.filter(pk=pk, user=request.user, is_active=False).first()
+    
+    if business is None:
+        # 삭제된 사업장이 없을 때만 활성 사업장인지 확인 (아니면 404)
+        if Business.active.filter(pk=pk, user=request.user).exists():
+            messages.warning(request, '이미 활성 상태인 사업장입니다.')
+            return redirect('businesses:business_detail', pk=pk)
+        raise Http404('사업장을 찾을 수 없습니다.')
     
     if request.method == 'POST':
         business.restore()
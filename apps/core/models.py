@@ -8,6 +8,7 @@
 
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -22,6 +23,23 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class SoftDeleteQuerySet(models.QuerySet):
+    """
+    여러 행을 UPDATE 1번으로 소프트 삭제/복구하는 QuerySet
+
+    모델의 soft_delete/restore 오버라이드(연쇄 삭제, 잔액 재계산 등)를 거치지 않으므로
+    행 단위 부가 처리가 없는 모델만 objects = SoftDeleteQuerySet.as_manager()로 씁니다.
+    """
+    
+    def soft_delete(self):
+        """일괄 소프트 삭제 (is_active=False), 변경된 행 수 반환"""
+        return self.update(is_active=False, updated_at=timezone.now())
+    
+    def restore(self):
+        """일괄 복구 (is_active=True), 변경된 행 수 반환"""
+        return self.update(is_active=True, updated_at=timezone.now())
+
+
 class SoftDeleteManager(models.Manager):
     """활성 데이터만 조회하는 Manager"""
     
@@ -56,6 +74,10 @@ class SoftDeleteManager(models.Manager):
     
     # 복구
     obj.restore()  # is_active=True
+    
+    # 일괄 삭제/복구 (UPDATE 1번, objects = SoftDeleteQuerySet.as_manager()인 모델만)
+    MyModel.objects.filter(...).soft_delete()
+    MyModel.objects.filter(...).restore()
 """
 
 class SoftDeleteModel(TimeStampedModel):
@@ -8,6 +8,16 @@ from datetime import datetime
 from .utils import SIMPLE_EXPENSE_RATES
 
 
+# 업종 선택지 (SIMPLE_EXPENSE_RATES는 고정값이므로 import 시 한 번만 생성)
+_BUSINESS_TYPE_CHOICES = (
+    ('', '선택 안 함 (실제 지출만 사용)'),
+    *(
+        (code, f"{info['name']} (경비율 {info['rate']*100:.0f}%)")
+        for code, info in SIMPLE_EXPENSE_RATES.items()
+    ),
+)
+
+
 class IncomeTaxCalculationForm(forms.Form):
     """종합소득세 계산 폼 - 간단 버전"""
     
@@ -19,6 +29,7 @@ class IncomeTaxCalculationForm(forms.Form):
     
     business_type = forms.ChoiceField(
         label='업종 (단순경비율 적용)',
+        choices=_BUSINESS_TYPE_CHOICES,
         required=False,
         widget=forms.Select(attrs={'class': 'form-select'}),
         help_text='업종을 선택하면 단순경비율 방식도 비교합니다'
@@ -48,14 +59,6 @@ class IncomeTaxCalculationForm(forms.Form):
         ]
         self.fields['year'].widget.choices = year_choices
         self.fields['year'].initial = current_year - 1  # 작년 기본
-        
-        # 업종 선택지
-        business_choices = [('', '선택 안 함 (실제 지출만 사용)')]
-        business_choices.extend([
-            (code, f"{info['name']} (경비율 {info['rate']*100:.0f}%)")
-            for code, info in SIMPLE_EXPENSE_RATES.items()
-        ])
-        self.fields['business_type'].choices = business_choices
     
     def clean_year(self):
         """연도 검증"""
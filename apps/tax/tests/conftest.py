@@ -0,0 +1,16 @@
+# =============================================================================
+# conftest.py - tax 테스트 공통 Fixtures
+# =============================================================================
+
+import pytest
+from django.urls import reverse
+
+
+# =============================================================================
+# URL (URL resolver 탐색은 세션 전체에서 한 번만)
+# =============================================================================
+
+@pytest.fixture(scope='session')
+def tax_report_url():
+    """종합소득세 리포트 URL"""
+    return reverse('tax:income_tax_report')
@@ -8,7 +8,8 @@ Tax 정확성 검증 테스트 (Pytest)
 - 부동소수점 오차 방지
 """
 import pytest
-from decimal import Decimal, ROUND_HALF_UP, getcontext
+from itertools import pairwise
+from decimal import Decimal, ROUND_HALF_UP, getcontext, localcontext, Inexact, Rounded
 from apps.tax.utils import (
     calculate_tax,
     calculate_simple_expense_method,
@@ -19,6 +20,71 @@ from apps.tax.utils import (
 )
 
 
+# =============================================================================
+# 공통 상수 (테스트 본문에서 매번 Decimal 문자열을 파싱하지 않도록)
+# =============================================================================
+
+ZERO = Decimal('0')
+ONE = Decimal('1')
+CENT = Decimal('0.01')
+LOCAL_TAX_RATE = Decimal('0.1')  # 지방소득세율 10%
+TOP_RATE = Decimal('0.45')
+ZERO_TAXES = (ZERO, ZERO, ZERO)  # (tax, local_tax, total)
+
+
+def to_cent(value):
+    """원 단위 소수점 2자리 ROUND_HALF_UP 반올림 (기대값 계산용)"""
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def assert_decimal_equal(actual, expected, msg=''):
+    """소수점 2자리 Decimal 두 값을 센트 단위 정수로 비교
+
+    실제값이 센트보다 작은 자릿수를 가지면 정수 변환 시 잘려 나가므로
+    자릿수를 먼저 확인한다.
+    """
+    assert actual.as_tuple().exponent >= -2, f"소수점 2자리 초과: {actual} {msg}"
+    assert int(actual * 100) == int(expected * 100), f"{actual} != {expected} {msg}"
+
+
+@pytest.fixture(scope="class")
+def decimal_context():
+    """클래스 단위로 고정된 Decimal 컨텍스트 (정밀도 28자리, 반올림 관련 트랩 해제)
+
+    연산 오류(InvalidOperation, DivisionByZero, Overflow) 트랩은 그대로 둔다.
+    """
+    with localcontext() as ctx:
+        ctx.prec = 28
+        ctx.traps[Inexact] = False
+        ctx.traps[Rounded] = False
+        yield ctx
+
+
+# (구간 경계값, 경계값 세율, 경계값 + 1원 세율)
+BRACKET_BOUNDARIES = (
+    (Decimal('14000000'), Decimal('0.06'), Decimal('0.15')),
+    (Decimal('50000000'), Decimal('0.15'), Decimal('0.24')),
+    (Decimal('88000000'), Decimal('0.24'), Decimal('0.35')),
+    (Decimal('150000000'), Decimal('0.35'), Decimal('0.38')),
+    (Decimal('300000000'), Decimal('0.38'), Decimal('0.40')),
+    (Decimal('500000000'), Decimal('0.40'), Decimal('0.42')),
+    (Decimal('1000000000'), Decimal('0.42'), Decimal('0.45')),
+)
+
+# (현재 소득, 다음 구간 한도)
+NEXT_BRACKET_CASES = (
+    (Decimal('10000000'), Decimal('14000000')),   # 1구간 → 2구간
+    (Decimal('30000000'), Decimal('50000000')),   # 2구간 → 3구간
+    (Decimal('60000000'), Decimal('88000000')),   # 3구간 → 4구간
+)
+
+# 세율표의 (한도, 세율) 쌍 - 마지막 구간 제외 (무한대)
+BRACKET_LIMIT_RATES = tuple(
+    (bracket['limit'], bracket['rate']) for bracket in TAX_BRACKETS_2024[:-1]
+)
+
+
+@pytest.mark.usefixtures("decimal_context")
 class TestDecimalPrecision:
     """Decimal 정확성 심화 검증"""
     
@@ -55,12 +121,9 @@ class TestDecimalPrecision:
                 f"총 세액 재계산 오차: {amount}"
             
             # 지방소득세 = 국세 × 0.1 (정확히)
-            expected_local = (result['tax'] * Decimal('0.1')).quantize(
-                Decimal('0.01'), 
-                rounding=ROUND_HALF_UP
-            )
-            assert result['local_tax'] == expected_local, \
-                f"지방소득세 계산 오차: {amount}"
+            expected_local = to_cent(result['tax'] * LOCAL_TAX_RATE)
+            assert_decimal_equal(result['local_tax'], expected_local,
+                                 f"지방소득세 계산 오차: {amount}")
     
     def test_decimal_context_precision(self):
         """Decimal 컨텍스트 정밀도 확인"""
@@ -74,7 +137,7 @@ class TestDecimalPrecision:
         result = calculate_tax(huge_amount)
         
         # 오버플로우 없이 계산
-        assert result['total'] > Decimal('0')
+        assert result['total'] > ZERO
         assert result['total'] < Decimal('999999999999999')  # 합리적 범위
     
     def test_quantize_consistency(self):
@@ -91,7 +154,7 @@ class TestDecimalPrecision:
             # 모든 결과는 소수점 2자리
             for key in ['tax', 'local_tax', 'total']:
                 value = result[key]
-                assert value == value.quantize(Decimal('0.01')), \
+                assert value == value.quantize(CENT), \
                     f"{key}는 소수점 2자리여야 합니다: {value}"
     
     def test_simple_expense_decimal_precision(self):
@@ -107,18 +170,12 @@ class TestDecimalPrecision:
             
             if result and result['can_use']:
                 # 경비 = 수입 × 경비율 (정확히)
-                expected_expense = (income * rate).quantize(
-                    Decimal('0.01'),
-                    rounding=ROUND_HALF_UP
-                )
+                expected_expense = to_cent(income * rate)
                 assert result['expense'] == expected_expense, \
                     f"경비 계산 오차: {biz_type}"
                 
                 # 소득금액 = 수입 - 경비 (정확히)
-                expected_income = (income - expected_expense).quantize(
-                    Decimal('0.01'),
-                    rounding=ROUND_HALF_UP
-                )
+                expected_income = to_cent(income - expected_expense)
                 assert result['income_amount'] == expected_income, \
                     f"소득금액 계산 오차: {biz_type}"
 
@@ -126,51 +183,39 @@ class TestDecimalPrecision:
 class TestBoundaryValues:
     """경계값 테스트 심화"""
     
-    @pytest.mark.parametrize("boundary,lower_rate,upper_rate", [
-        (Decimal('14000000'), Decimal('0.06'), Decimal('0.15')),
-        (Decimal('50000000'), Decimal('0.15'), Decimal('0.24')),
-        (Decimal('88000000'), Decimal('0.24'), Decimal('0.35')),
-        (Decimal('150000000'), Decimal('0.35'), Decimal('0.38')),
-        (Decimal('300000000'), Decimal('0.38'), Decimal('0.40')),
-        (Decimal('500000000'), Decimal('0.40'), Decimal('0.42')),
-        (Decimal('1000000000'), Decimal('0.42'), Decimal('0.45')),
-    ])
-    def test_tax_bracket_boundaries_exact(self, boundary, lower_rate, upper_rate):
-        """세율 구간 경계값 정확한 세율 적용"""
-        # 경계값 정확히
-        result_exact = calculate_tax(boundary)
-        assert result_exact['rate'] == lower_rate, \
-            f"경계값에서는 하위 세율 적용: {boundary}"
-        
-        # 경계값 + 1원 (다음 구간)
-        result_next = calculate_tax(boundary + Decimal('1'))
-        assert result_next['rate'] == upper_rate, \
-            f"경계값 초과 시 상위 세율 적용: {boundary + 1}"
-        
-        # 세금 연속성 (급격한 변화 없음)
-        tax_diff = result_next['total'] - result_exact['total']
+    def test_tax_bracket_boundaries_exact(self):
+        """세율 구간 경계값 정확한 세율 적용 (모든 경계를 한 번에 검사)"""
+        failures = []
+        for boundary, lower_rate, upper_rate in BRACKET_BOUNDARIES:
+            result_exact = calculate_tax(boundary)       # 경계값 정확히
+            result_next = calculate_tax(boundary + ONE)  # 경계값 + 1원 (다음 구간)
+            
+            if result_exact['rate'] != lower_rate:
+                failures.append(f"경계값에서는 하위 세율 적용: {boundary}")
+            if result_next['rate'] != upper_rate:
+                failures.append(f"경계값 초과 시 상위 세율 적용: {boundary + ONE}")
+            
+            # 1원 차이로 세금이 비합리적으로 증가하지 않음
+            # (누진공제로 인해 오히려 부드럽게 증가)
+            tax_diff = result_next['total'] - result_exact['total']
+            if tax_diff >= boundary * CENT:
+                failures.append(f"경계값에서 세금 급증 없음: {boundary} → {tax_diff}")
         
-        # 1원 차이로 세금이 비합리적으로 증가하지 않음
-        # (누진공제로 인해 오히려 부드럽게 증가)
-        assert tax_diff < boundary * Decimal('0.01'), \
-            f"경계값에서 세금 급증 없음: {tax_diff}"
+        assert not failures, "\n".join(failures)
     
     def test_zero_and_one_won(self):
         """극단값: 0원, 1원"""
         # 0원
-        result_zero = calculate_tax(Decimal('0'))
-        assert result_zero['total'] == Decimal('0')
-        assert result_zero['rate'] == Decimal('0')
+        result_zero = calculate_tax(ZERO)
+        assert result_zero['total'] == ZERO
+        assert result_zero['rate'] == ZERO
         
         # 1원 (최저 과세)
-        result_one = calculate_tax(Decimal('1'))
+        result_one = calculate_tax(ONE)
         assert result_one['rate'] == Decimal('0.06')
         
         # 1원의 6% = 0.06원 → 0.01원으로 반올림
-        expected_tax = (Decimal('1') * Decimal('0.06')).quantize(
-            Decimal('0.01'),
-            rounding=ROUND_HALF_UP
-        )
+        expected_tax = to_cent(ONE * Decimal('0.06'))
         assert result_one['tax'] == expected_tax
     
     def test_negative_values_handled(self):
@@ -184,37 +229,23 @@ class TestBoundaryValues:
         for value in negative_values:
             result = calculate_tax(value)
             
-            # 모든 결과는 0
-            assert result['total'] == Decimal('0')
-            assert result['tax'] == Decimal('0')
-            assert result['local_tax'] == Decimal('0')
+            # 모든 결과는 0 (국세, 지방세, 총액을 한 번에 비교)
+            assert (result['tax'], result['local_tax'], result['total']) == ZERO_TAXES, \
+                f"음수 과세표준은 세금 0원: {value}"
     
-    @pytest.mark.parametrize("business_type", list(SIMPLE_EXPENSE_RATES.keys()))
-    def test_simple_expense_limit_boundaries(self, business_type):
-        """단순경비율 한도 경계값"""
-        rate_info = SIMPLE_EXPENSE_RATES[business_type]
-        limit = rate_info['limit']
-        
-        # 한도 - 1원 (사용 가능)
-        result_ok = calculate_simple_expense_method(
-            limit - Decimal('1'),
-            business_type
-        )
-        assert result_ok['can_use'] is True
-        
-        # 한도 정확히 (사용 가능)
-        result_exact = calculate_simple_expense_method(
-            limit,
-            business_type
-        )
-        assert result_exact['can_use'] is True
-        
-        # 한도 + 1원 (사용 불가)
-        result_over = calculate_simple_expense_method(
-            limit + Decimal('1'),
-            business_type
-        )
-        assert result_over['can_use'] is False
+    def test_simple_expense_limit_boundaries(self):
+        """단순경비율 한도 경계값 (모든 업종을 한 번에 검사)"""
+        failures = []
+        for business_type, rate_info in SIMPLE_EXPENSE_RATES.items():
+            limit = rate_info['limit']
+            # (수입금액, 사용 가능 여부): 한도 - 1원, 한도 정확히, 한도 + 1원
+            checks = ((limit - ONE, True), (limit, True), (limit + ONE, False))
+            for income, can_use in checks:
+                result = calculate_simple_expense_method(income, business_type)
+                if result['can_use'] is not can_use:
+                    failures.append(f"{business_type} {income}: can_use={result['can_use']}")
+        
+        assert not failures, "\n".join(failures)
     
     def test_very_large_amounts(self):
         """매우 큰 금액 처리"""
@@ -228,13 +259,13 @@ class TestBoundaryValues:
             result = calculate_tax(amount)
             
             # 최고 세율 적용
-            assert result['rate'] == Decimal('0.45')
+            assert result['rate'] == TOP_RATE
             
-            # 계산 오류 없음
-            assert result['total'] > Decimal('0')
-            assert result['total'] < amount  # 세금이 원금 초과 불가
+            # 계산 오류 없음, 세금이 원금 초과 불가 (원 단위 정수로 범위만 확인)
+            assert 0 < int(result['total']) < int(amount)
 
 
+@pytest.mark.usefixtures("decimal_context")
 class TestCalculationAccuracy:
     """금액 계산 정확성"""
     
@@ -257,14 +288,11 @@ class TestCalculationAccuracy:
             assert result['deduction'] == deduction
             
             # 세액 = 과세표준 × 세율 - 누진공제
-            expected_tax = (taxable * rate - deduction).quantize(
-                Decimal('0.01'),
-                rounding=ROUND_HALF_UP
-            )
-            expected_tax = max(expected_tax, Decimal('0'))  # 음수 방지
+            expected_tax = to_cent(taxable * rate - deduction)
+            expected_tax = max(expected_tax, ZERO)  # 음수 방지
             
-            assert result['tax'] == expected_tax, \
-                f"세액 계산 오차: {taxable}"
+            assert_decimal_equal(result['tax'], expected_tax,
+                                 f"세액 계산 오차: {taxable}")
     
     def test_local_tax_always_10_percent(self):
         """지방소득세는 항상 국세의 정확히 10%"""
@@ -279,13 +307,10 @@ class TestCalculationAccuracy:
             result = calculate_tax(income)
             
             # 지방소득세 = 국세 × 0.1
-            expected_local = (result['tax'] * Decimal('0.1')).quantize(
-                Decimal('0.01'),
-                rounding=ROUND_HALF_UP
-            )
+            expected_local = to_cent(result['tax'] * LOCAL_TAX_RATE)
             
-            assert result['local_tax'] == expected_local, \
-                f"지방소득세는 국세의 10%: {income}"
+            assert_decimal_equal(result['local_tax'], expected_local,
+                                 f"지방소득세는 국세의 10%: {income}")
             
             # 총 세액 = 국세 + 지방소득세
             assert result['total'] == result['tax'] + result['local_tax']
@@ -301,11 +326,11 @@ class TestCalculationAccuracy:
             result = calculate_simple_expense_method(income, biz_type)
             
             # 경비 = 수입 × 경비율
-            expected_expense = (income * rate).quantize(Decimal('0.01'))
+            expected_expense = (income * rate).quantize(CENT)
             assert result['expense'] == expected_expense
             
             # 소득금액 = 수입 - 경비
-            expected_income_amount = (income - expected_expense).quantize(Decimal('0.01'))
+            expected_income_amount = (income - expected_expense).quantize(CENT)
             assert result['income_amount'] == expected_income_amount
             
             # 재계산 검증
@@ -330,43 +355,45 @@ class TestCalculationAccuracy:
             tax_saved = item['tax_saved']
             
             # 절세액 = 금액 × 세율
-            expected_saved = (amount * tax_rate).quantize(Decimal('0.01'))
+            expected_saved = (amount * tax_rate).quantize(CENT)
             
             assert tax_saved == expected_saved, \
                 f"{category} 절세액 계산 오차"
     
     def test_monotonic_increase(self):
         """소득 증가 → 세금 단조증가 (역전 없음)"""
-        incomes = []
-        for i in range(1000000, 200000000, 5000000):  # 100만원부터 2억까지
-            incomes.append(Decimal(str(i)))
-        
+        # 100만원부터 2억까지 (int → Decimal 직접 변환, str 경유 없음)
+        incomes = [Decimal(i) for i in range(1000000, 200000000, 5000000)]
         taxes = [calculate_tax(income)['total'] for income in incomes]
         
-        # 모든 구간에서 단조증가
-        for i in range(len(taxes) - 1):
-            assert taxes[i] <= taxes[i + 1], \
-                f"세금 역전 발생: {incomes[i]} vs {incomes[i+1]}"
+        # 모든 구간에서 단조증가 (인접 쌍을 한 번에 비교)
+        inversions = [
+            (low, high)
+            for (low, high), (tax_low, tax_high) in zip(pairwise(incomes), pairwise(taxes))
+            if tax_low > tax_high
+        ]
+        assert not inversions, f"세금 역전 발생: {inversions}"
 
 
 class TestNextBracketDistance:
     """다음 세율 구간까지 거리 정확성"""
     
-    @pytest.mark.parametrize("current_income,expected_next_limit", [
-        (Decimal('10000000'), Decimal('14000000')),   # 1구간 → 2구간
-        (Decimal('30000000'), Decimal('50000000')),   # 2구간 → 3구간
-        (Decimal('60000000'), Decimal('88000000')),   # 3구간 → 4구간
-    ])
-    def test_distance_calculation_accuracy(self, current_income, expected_next_limit):
-        """거리 계산 정확성"""
-        result = calculate_next_bracket_distance(current_income)
-        
-        assert result is not None
-        assert result['next_limit'] == expected_next_limit
+    def test_distance_calculation_accuracy(self):
+        """거리 계산 정확성 (모든 케이스를 한 번에 검사)"""
+        failures = []
+        for current_income, expected_next_limit in NEXT_BRACKET_CASES:
+            result = calculate_next_bracket_distance(current_income)
+            if result is None:
+                failures.append(f"다음 구간 없음: {current_income}")
+                continue
+            
+            # 거리 = 다음 한도 - 현재 소득
+            expected_distance = (expected_next_limit - current_income).quantize(CENT)
+            actual = (result['next_limit'], result['distance'])
+            if actual != (expected_next_limit, expected_distance):
+                failures.append(f"{current_income}: {actual}")
         
-        # 거리 = 다음 한도 - 현재 소득
-        expected_distance = expected_next_limit - current_income
-        assert result['distance'] == expected_distance.quantize(Decimal('0.01'))
+        assert not failures, "\n".join(failures)
     
     def test_max_bracket_no_next(self):
         """최고 구간에서는 다음 구간 없음"""
@@ -385,10 +412,7 @@ class TestEdgeCasesAccuracy:
     def test_exact_tax_bracket_limits(self):
         """세율 구간 한도 정확히 계산"""
         # TAX_BRACKETS_2024의 한도값들로 계산
-        for bracket in TAX_BRACKETS_2024[:-1]:  # 마지막 제외 (무한대)
-            limit = bracket['limit']
-            rate = bracket['rate']
-            
+        for limit, rate in BRACKET_LIMIT_RATES:
             result = calculate_tax(limit)
             
             # 한도 금액에서는 해당 세율 적용
@@ -402,10 +426,10 @@ class TestEdgeCasesAccuracy:
         result = calculate_tax(low_income)
         
         # 1구간 누진공제 = 0
-        assert result['deduction'] == Decimal('0')
+        assert result['deduction'] == ZERO
         
         # 세액 = 과세표준 × 6%
-        expected_tax = (low_income * Decimal('0.06')).quantize(Decimal('0.01'))
+        expected_tax = (low_income * Decimal('0.06')).quantize(CENT)
         assert result['tax'] == expected_tax
     
     def test_rounding_consistency(self):
@@ -419,14 +443,10 @@ class TestEdgeCasesAccuracy:
         for value in test_values:
             result = calculate_tax(value)
             
-            # 모든 결과는 ROUND_HALF_UP 규칙 준수
+            # 모든 결과는 소수점 2자리 이하 (문자열 변환 없이 지수로 확인)
             for key in ['tax', 'local_tax', 'total']:
                 val = result[key]
-                # 소수점 2자리로 정확히 표현됨
-                assert str(val).count('.') <= 1
-                if '.' in str(val):
-                    decimals = str(val).split('.')[1]
-                    assert len(decimals) <= 2
+                assert val.as_tuple().exponent >= -2, f"{key}는 소수점 2자리 이하여야 합니다: {val}"
 
 
 if __name__ == '__main__':
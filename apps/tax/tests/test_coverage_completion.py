@@ -11,7 +11,7 @@ from decimal import Decimal
 from datetime import datetime, timezone
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.contrib.auth.models import User
-from django.urls import reverse
+from django.db import transaction
 
 from apps.tax.forms import IncomeTaxCalculationForm
 from apps.tax.utils import (
@@ -23,6 +23,13 @@ from apps.transactions.models import Transaction, Category
 from apps.businesses.models import Business, Account
 
 
+# 공통 상수
+ZERO = Decimal('0')
+FLOW_DEDUCTION = Decimal('2000000')  # 통합 흐름 테스트의 소득공제액
+AVG_TAX_RATE = Decimal('0.15')
+CURRENT_YEAR = datetime.now().year  # 모듈 로드 시 한 번만 조회
+
+
 class TestFormsValidationErrors:
     """forms.py 누락 라인 커버 - ValidationError 케이스"""
     
@@ -40,8 +47,7 @@ class TestFormsValidationErrors:
     
     def test_year_future_validation(self):
         """연도 현재 연도 초과 거부 (62-68 라인)"""
-        current_year = datetime.now().year
-        future_year = current_year + 1
+        future_year = CURRENT_YEAR + 1
         
         form = IncomeTaxCalculationForm(data={
             'year': future_year,
@@ -51,7 +57,7 @@ class TestFormsValidationErrors:
         
         assert not form.is_valid()
         assert 'year' in form.errors
-        assert str(current_year) in str(form.errors['year'])
+        assert str(CURRENT_YEAR) in str(form.errors['year'])
     
     def test_deduction_negative_validation(self):
         """소득공제액 음수 거부 (72-80 라인)"""
@@ -191,63 +197,60 @@ class TestUtilsEdgeCases:
 class TestViewsEdgeCases:
     """views.py 누락 라인 커버 (46-47)"""
     
-    @pytest.fixture
-    def user(self):
-        return User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-    
-    @pytest.fixture
-    def business(self, user):
-        return Business.objects.create(
-            user=user,
-            name='테스트 사업장',
-            business_type='음식점',
-            branch_type='main'
-        )
-    
-    @pytest.fixture
-    def account(self, user, business):
-        return Account.objects.create(
-            user=user,
-            business=business,
-            name='테스트 계좌',
-            bank_name='테스트은행',
-            account_number='1234567890',
-            balance=Decimal('0')
-        )
-    
-    @pytest.fixture
-    def income_category(self):
-        return Category.objects.create(
-            name='매출',
-            type='income',
-            is_system=True
-        )
+    @pytest.fixture(scope='class')
+    def report_user(self, django_db_setup, django_db_blocker):
+        """
+        거래 1건이 있는 사용자 (클래스당 한 번만 생성)
+        
+        두 테스트 모두 같은 데이터를 읽기만 하므로 바깥 트랜잭션 안에서 한 번 만들고,
+        클래스가 끝나면 롤백합니다. 각 테스트의 django_db 트랜잭션은 그 안의 savepoint가 됩니다.
+        """
+        with django_db_blocker.unblock(), transaction.atomic():
+            user = User.objects.create_user(
+                username='testuser',
+                email='test@example.com',
+                password='testpass123'
+            )
+            business = Business.objects.create(
+                user=user,
+                name='테스트 사업장',
+                business_type='음식점',
+                branch_type='main'
+            )
+            account = Account.objects.create(
+                user=user,
+                business=business,
+                name='테스트 계좌',
+                bank_name='테스트은행',
+                account_number='1234567890',
+                balance=Decimal('0')
+            )
+            income_category = Category.objects.create(
+                name='매출',
+                type='income',
+                is_system=True
+            )
+            Transaction.objects.create(
+                user=user,
+                business=business,
+                account=account,
+                category=income_category,
+                tx_type='IN',
+                amount=Decimal('20000000'),
+                occurred_at=datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
+                merchant_name='고객',
+                is_business=True
+            )
+            yield user
+            transaction.set_rollback(True)
     
-    def test_invalid_deduction_amount_parameter(self, client, user, business, account, income_category):
+    def test_invalid_deduction_amount_parameter(self, client, report_user, tax_report_url):
         """잘못된 소득공제액 파라미터 처리 (46-47 라인)"""
-        client.force_login(user)
-        
-        # 거래 생성
-        Transaction.objects.create(
-            user=user,
-            business=business,
-            account=account,
-            category=income_category,
-            tx_type='IN',
-            amount=Decimal('20000000'),
-            occurred_at=datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
-            merchant_name='고객',
-            is_business=True
-        )
+        client.force_login(report_user)
         
-        url = reverse('tax:income_tax_report')
         
         # 잘못된 deduction_amount 파라미터
-        response = client.get(url, {
+        response = client.get(tax_report_url, {
             'year': 2024,
             'deduction_amount': 'invalid_number'  # 숫자 변환 실패
         })
@@ -256,25 +259,30 @@ class TestViewsEdgeCases:
         assert response.status_code == 200
         assert response.context['deduction_amount'] == Decimal('1500000')  # 기본값
     
-    def test_missing_deduction_amount_uses_default(self, client, user, business, account, income_category):
+    def test_non_finite_deduction_amount_uses_default(self, client, report_user, tax_report_url):
+        """NaN/Infinity 소득공제액은 기본값 사용"""
+        client.force_login(report_user)
+        
+        for raw in ('NaN', 'Infinity'):
+            response = client.get(tax_report_url, {'year': 2024, 'deduction_amount': raw})
+            
+            assert response.status_code == 200
+            assert response.context['deduction_amount'] == Decimal('1500000')
+    
+    def test_invalid_year_parameter_uses_last_year(self, client, report_user, tax_report_url):
+        """숫자가 아닌 연도 파라미터는 작년으로 처리"""
+        client.force_login(report_user)
+        
+        response = client.get(tax_report_url, {'year': 'abc'})
+        
+        assert response.status_code == 200
+        assert response.context['selected_year'] == CURRENT_YEAR - 1
+    
+    def test_missing_deduction_amount_uses_default(self, client, report_user, tax_report_url):
         """소득공제액 파라미터 없을 때 기본값 사용"""
-        client.force_login(user)
-        
-        # 거래 생성
-        Transaction.objects.create(
-            user=user,
-            business=business,
-            account=account,
-            category=income_category,
-            tx_type='IN',
-            amount=Decimal('20000000'),
-            occurred_at=datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
-            merchant_name='고객',
-            is_business=True
-        )
+        client.force_login(report_user)
         
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': 2024})  # deduction_amount 없음
+        response = client.get(tax_report_url, {'year': 2024})  # deduction_amount 없음
         
         # 기본값 150만원 사용
         assert response.status_code == 200
@@ -295,8 +303,7 @@ class TestFormsInitialization:
         assert len(year_choices) == 5
         
         # 작년이 기본값
-        current_year = datetime.now().year
-        assert form.fields['year'].initial == current_year - 1
+        assert form.fields['year'].initial == CURRENT_YEAR - 1
     
     def test_form_business_type_choices(self):
         """업종 선택지 생성"""
@@ -373,58 +380,37 @@ class TestUtilsComprehensiveCoverage:
 class TestIntegrationCoverage:
     """통합 시나리오로 누락 라인 커버"""
     
-    def test_complete_tax_calculation_flow(self):
-     
-        """전체 세금 계산 흐름"""
-        # 1. 수입/지출
-        total_income = Decimal('50000000')
-        total_expense = Decimal('30000000')
-        
-        # 2. 실제 지출 방식
-        actual_income_amount = total_income - total_expense
-        deduction = Decimal('2000000')
-        actual_taxable = max(actual_income_amount - deduction, Decimal('0'))
+    @pytest.mark.parametrize("total_income,total_expense,business_type,can_use", [
+        (Decimal('50000000'), Decimal('30000000'), 'restaurant', False),  # 한도 초과
+        (Decimal('30000000'), Decimal('20000000'), 'restaurant', True),
+        (Decimal('20000000'), Decimal('10000000'), 'it', True),
+    ])
+    def test_complete_tax_calculation_flow(self, total_income, total_expense, business_type, can_use):
+        """전체 세금 계산 흐름 (실제 지출 vs 단순경비율 → 절세 팁)"""
+        # 1. 실제 지출 방식
+        actual_taxable = max(total_income - total_expense - FLOW_DEDUCTION, ZERO)
         actual_result = calculate_tax(actual_taxable)
         
-        # 3. 단순경비율 방식
-        simple_result = calculate_simple_expense_method(total_income, 'restaurant')
-
-        # 만약 한도 초과 상황도 테스트하고 싶다면 체크 로직 추가
-        if simple_result['can_use']:
-            simple_taxable = max(simple_result['income_amount'] - deduction, Decimal('0'))
-            # 성공했을 때의 추가 검증(assert)도 이 안에 넣는 게 안전합니다.
-            assert 'income_amount' in simple_result
-        else:
-            # 한도 초과 시에는 계산을 건너뛰거나 0으로 설정
-            simple_taxable = Decimal('0') 
-            print(f"계산 건너뜀: {simple_result['reason']}")
-            
-        #simple_taxable = max(simple_result['income_amount'] - deduction, Decimal('0'))
+        # 2. 단순경비율 방식 (한도 초과면 소득금액이 없으므로 과세표준 0)
+        simple_result = calculate_simple_expense_method(total_income, business_type)
+        assert simple_result['can_use'] is can_use
+        simple_taxable = max(simple_result.get('income_amount', ZERO) - FLOW_DEDUCTION, ZERO)
         simple_tax_result = calculate_tax(simple_taxable)
         
-        # 4. 절세 팁 생성
+        # 3. 절세 팁 생성
         categories = [
-            {'category': '인건비', 'amount': total_expense, 'tax_saved': total_expense * Decimal('0.15')}
+            {'category': '인건비', 'amount': total_expense, 'tax_saved': total_expense * AVG_TAX_RATE}
         ]
-        
         tip = get_tax_saving_tip(
             actual_result['total'],
             simple_tax_result['total'],
             categories
         )
         
-        # 모든 단계 정상 실행
-        assert actual_result['total'] > Decimal('0')
+        # 모든 단계 정상 실행 (단순경비율 세액은 사용 가능할 때만 0원 초과)
+        assert actual_result['total'] > ZERO
         assert len(tip) > 0
-
-        # 단순경비율은 한도 초과 시 0일 수 있으므로 이를 허용하거나, 
-        # 혹은 can_use 상태에 따라 다르게 검증합니다.
-        if simple_result['can_use']:
-            assert simple_tax_result['total'] > Decimal('0')
-        else:
-            assert simple_tax_result['total'] == Decimal('0')
-
-
+        assert (simple_tax_result['total'] > ZERO) is can_use
 
 
 if __name__ == '__main__':
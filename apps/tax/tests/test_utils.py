@@ -7,6 +7,8 @@ Tax Utils 테스트 (Pytest)
 """
 import pytest
 from decimal import Decimal
+from itertools import pairwise
+from typing import NamedTuple
 from apps.tax.utils import (
     calculate_tax,
     calculate_simple_expense_method,
@@ -15,62 +17,89 @@ from apps.tax.utils import (
 )
 
 
+# 업종 코드 목록 (수집 시 한 번만 생성)
+BUSINESS_TYPES = tuple(SIMPLE_EXPENSE_RATES)
+
+
+class BracketCase(NamedTuple):
+    """세율 구간별 기대값 (과세표준, 예상세율, 최소 총세액, 최대 총세액)"""
+    taxable_income: Decimal
+    rate: Decimal
+    total_min: Decimal
+    total_max: Decimal
+
+
+BRACKET_CASES = (
+    # 1구간: 1,400만원 이하 (6%)
+    BracketCase(Decimal('10000000'), Decimal('0.06'), Decimal('600000'), Decimal('660000')),
+    BracketCase(Decimal('14000000'), Decimal('0.06'), Decimal('840000'), Decimal('924000')),
+    
+    # 2구간: 1,400만원 ~ 5,000만원 (15%)
+    BracketCase(Decimal('20000000'), Decimal('0.15'), Decimal('1740000'), Decimal('1914000')),
+    BracketCase(Decimal('50000000'), Decimal('0.15'), Decimal('6240000'), Decimal('6864000')),
+    
+    # 3구간: 5,000만원 ~ 8,800만원 (24%)
+    BracketCase(Decimal('70000000'), Decimal('0.24'), Decimal('11040000'), Decimal('12144000')),
+    BracketCase(Decimal('88000000'), Decimal('0.24'), Decimal('15360000'), Decimal('16896000')),
+    
+    # 4구간: 8,800만원 ~ 1.5억원 (35%)
+    BracketCase(Decimal('100000000'), Decimal('0.35'), Decimal('19560000'), Decimal('21516000')),
+    BracketCase(Decimal('150000000'), Decimal('0.35'), Decimal('37060000'), Decimal('40766000')),
+    
+    # 5구간: 1.5억원 ~ 3억원 (38%)
+    BracketCase(Decimal('200000000'), Decimal('0.38'), Decimal('56060000'), Decimal('61666000')),
+    BracketCase(Decimal('300000000'), Decimal('0.38'), Decimal('94060000'), Decimal('103466000')),
+    
+    # 6구간: 3억원 ~ 5억원 (40%)
+    BracketCase(Decimal('400000000'), Decimal('0.40'), Decimal('134060000'), Decimal('147466000')),
+    BracketCase(Decimal('500000000'), Decimal('0.40'), Decimal('174060000'), Decimal('191466000')),
+    
+    # 7구간: 5억원 ~ 10억원 (42%)
+    BracketCase(Decimal('700000000'), Decimal('0.42'), Decimal('258060000'), Decimal('283866000')),
+    BracketCase(Decimal('1000000000'), Decimal('0.42'), Decimal('384060000'), Decimal('422466000')),
+    
+    # 8구간: 10억원 초과 (45%)
+    BracketCase(Decimal('1500000000'), Decimal('0.45'), Decimal('609060000'), Decimal('669966000')),
+    BracketCase(Decimal('2000000000'), Decimal('0.45'), Decimal('834060000'), Decimal('917466000')),
+)
+
+
 class TestCalculateTax:
     """세액 계산 함수 테스트"""
     
-    @pytest.mark.parametrize("taxable_income,expected_rate,expected_tax_min,expected_tax_max", [
-        # (과세표준, 예상세율, 최소세액, 최대세액)
-        # 1구간: 1,400만원 이하 (6%)
-        (Decimal('10000000'), Decimal('0.06'), Decimal('600000'), Decimal('660000')),
-        (Decimal('14000000'), Decimal('0.06'), Decimal('840000'), Decimal('924000')),
-        
-        # 2구간: 1,400만원 ~ 5,000만원 (15%)
-        (Decimal('20000000'), Decimal('0.15'), Decimal('1740000'), Decimal('1914000')),
-        (Decimal('50000000'), Decimal('0.15'), Decimal('6240000'), Decimal('6864000')),
-        
-        # 3구간: 5,000만원 ~ 8,800만원 (24%)
-        (Decimal('70000000'), Decimal('0.24'), Decimal('11040000'), Decimal('12144000')),
-        (Decimal('88000000'), Decimal('0.24'), Decimal('15360000'), Decimal('16896000')),
-        
-        # 4구간: 8,800만원 ~ 1.5억원 (35%)
-        (Decimal('100000000'), Decimal('0.35'), Decimal('19560000'), Decimal('21516000')),
-        (Decimal('150000000'), Decimal('0.35'), Decimal('37060000'), Decimal('40766000')),
-        
-        # 5구간: 1.5억원 ~ 3억원 (38%)
-        (Decimal('200000000'), Decimal('0.38'), Decimal('56060000'), Decimal('61666000')),
-        (Decimal('300000000'), Decimal('0.38'), Decimal('94060000'), Decimal('103466000')),
-        
-        # 6구간: 3억원 ~ 5억원 (40%)
-        (Decimal('400000000'), Decimal('0.40'), Decimal('134060000'), Decimal('147466000')),
-        (Decimal('500000000'), Decimal('0.40'), Decimal('174060000'), Decimal('191466000')),
-        
-        # 7구간: 5억원 ~ 10억원 (42%)
-        (Decimal('700000000'), Decimal('0.42'), Decimal('258060000'), Decimal('283866000')),
-        (Decimal('1000000000'), Decimal('0.42'), Decimal('384060000'), Decimal('422466000')),
-        
-        # 8구간: 10억원 초과 (45%)
-        (Decimal('1500000000'), Decimal('0.45'), Decimal('609060000'), Decimal('669966000')),
-        (Decimal('2000000000'), Decimal('0.45'), Decimal('834060000'), Decimal('917466000')),
-    ])
-    def test_tax_calculation_by_bracket(self, taxable_income, expected_rate, expected_tax_min, expected_tax_max):
-        """세율 구간별 정확한 계산 (지방소득세 포함)"""
-        result = calculate_tax(taxable_income)
-        
-        # 세율 확인
-        assert result['rate'] == expected_rate, f"세율이 {expected_rate}여야 합니다"
-        
-        # 총 세액 범위 확인 (국세 + 지방소득세 10%)
-        assert expected_tax_min <= result['total'] <= expected_tax_max, \
-            f"총 세액이 {expected_tax_min}~{expected_tax_max} 범위여야 합니다 (실제: {result['total']})"
+    def test_tax_calculation_by_bracket(self):
+        """세율 구간별 정확한 계산 (지방소득세 포함, 모든 구간을 한 번에 검사)"""
+        failures = []
+        for case in BRACKET_CASES:
+            result = calculate_tax(case.taxable_income)
+            
+            # 세율 확인
+            if result['rate'] != case.rate:
+                failures.append(f"{case.taxable_income}: 세율이 {case.rate}여야 합니다 (실제: {result['rate']})")
+            
+            # 총 세액 범위 확인 (국세 + 지방소득세 10%)
+            if not case.total_min <= result['total'] <= case.total_max:
+                failures.append(
+                    f"{case.taxable_income}: 총 세액이 {case.total_min}~{case.total_max} 범위여야 합니다 "
+                    f"(실제: {result['total']})"
+                )
+            
+            # 지방소득세 = 국세의 10%
+            if abs(result['local_tax'] - result['tax'] * Decimal('0.1')) >= Decimal('0.01'):
+                failures.append(f"{case.taxable_income}: 지방소득세는 국세의 10%여야 합니다")
+            
+            # 총 세액 = 국세 + 지방소득세
+            if result['total'] != result['tax'] + result['local_tax']:
+                failures.append(f"{case.taxable_income}: 총 세액 = 국세 + 지방소득세")
         
-        # 지방소득세 = 국세의 10%
-        expected_local = result['tax'] * Decimal('0.1')
-        assert abs(result['local_tax'] - expected_local) < Decimal('0.01'), \
-            "지방소득세는 국세의 10%여야 합니다"
+        assert not failures, "\n".join(failures)
+    
+    def test_tax_result_is_copy_of_cached_result(self):
+        """반환 dict를 수정해도 같은 입력의 다음 결과에 영향 없음"""
+        first = calculate_tax(Decimal('30000000'))
+        first['total'] = Decimal('-1')
         
-        # 총 세액 = 국세 + 지방소득세
-        assert result['total'] == result['tax'] + result['local_tax'], \
-            "총 세액 = 국세 + 지방소득세"
+        assert calculate_tax(Decimal('30000000'))['total'] > Decimal('0')
     
     def test_tax_zero_or_negative(self):
         """0원 또는 음수 입력 시 세금 0원"""
@@ -109,6 +138,11 @@ class TestCalculateTax:
         assert result_after['total'] > result_boundary['total']
         assert result_boundary['total'] > result_before['total']
     
+    def test_tax_bracket_fractional_boundary(self):
+        """한도를 1전이라도 넘으면 다음 구간 세율 적용"""
+        assert calculate_tax(Decimal('14000000.00'))['rate'] == Decimal('0.06')
+        assert calculate_tax(Decimal('14000000.01'))['rate'] == Decimal('0.15')
+    
     def test_tax_decimal_precision(self):
         """Decimal 소수점 2자리 정확성"""
         result = calculate_tax(Decimal('12345678.99'))
@@ -186,7 +220,7 @@ class TestCalculateSimpleExpenseMethod:
         
         assert result is None, "잘못된 업종은 None을 반환해야 합니다"
     
-    @pytest.mark.parametrize("business_type", list(SIMPLE_EXPENSE_RATES.keys()))
+    @pytest.mark.parametrize("business_type", BUSINESS_TYPES)
     def test_simple_expense_all_business_types(self, business_type):
         """모든 업종에 대한 기본 계산 확인"""
         rate_info = SIMPLE_EXPENSE_RATES[business_type]
@@ -246,9 +280,9 @@ class TestTaxCalculationIntegrity:
         taxes = [calculate_tax(income)['total'] for income in incomes]
         
         # 소득이 증가하면 세금도 증가해야 함
-        for i in range(len(taxes) - 1):
-            assert taxes[i] < taxes[i + 1], \
-                f"소득 증가 시 세금도 증가해야 합니다: {taxes[i]} >= {taxes[i+1]}"
+        for low, high in pairwise(taxes):
+            assert low < high, \
+                f"소득 증가 시 세금도 증가해야 합니다: {low} >= {high}"
     
     def test_simple_vs_actual_logic(self):
         """단순경비율 vs 실제지출 비교 시나리오"""
@@ -10,7 +10,8 @@ import pytest
 from decimal import Decimal
 from datetime import datetime, timedelta
 from django.contrib.auth.models import User
-from django.urls import reverse
+from django.db import transaction
+from django.test import Client
 
 from datetime import datetime, timezone as dt_timezone  # 파이썬 표준 라이브러리
 from django.utils import timezone  # 장고 유틸리티
@@ -19,94 +20,143 @@ from apps.transactions.models import Transaction, Category
 from apps.businesses.models import Business, Account
 
 timezone.utc = dt_timezone.utc
+
+# 거래 일시 (매월 15일 정오, UTC) - 테스트 본문에서 매번 만들지 않도록 모듈 로드 시 한 번 생성
+MONTH_DATES_2024 = tuple(
+    datetime(2024, month, 15, 12, 0, 0, tzinfo=dt_timezone.utc)
+    for month in range(1, 13)
+)
+BASE_DATE_2024 = MONTH_DATES_2024[5]  # 2024-06-15
+BASE_DATE_2023 = datetime(2023, 6, 15, 12, 0, 0, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture(scope='class')
+def report_data(django_db_setup, django_db_blocker):
+    """
+    사용자/사업장/계좌/카테고리 (클래스당 한 번만 생성)
+    
+    테스트마다 같은 기본 데이터가 필요하므로 바깥 트랜잭션 안에서 한 번 만들고,
+    클래스가 끝나면 롤백합니다. 각 테스트의 django_db 트랜잭션은 그 안의 savepoint가 되어
+    테스트에서 만든 거래는 테스트마다 되돌려집니다.
+    """
+    with django_db_blocker.unblock(), transaction.atomic():
+        user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        business = Business.objects.create(
+            user=user,
+            name='테스트 사업장',
+            business_type='음식점',
+            branch_type='main'
+        )
+        account = Account.objects.create(
+            user=user,
+            business=business,
+            name='테스트 계좌',
+            bank_name='테스트은행',
+            account_number='1234567890',
+            balance=Decimal('0')
+        )
+        income_category = Category.objects.create(
+            name='매출',
+            type='income',
+            is_system=True,
+            order=1
+        )
+        
+        expense_categories = []
+        expense_types = [
+            ('인건비', 'salary'),
+            ('임차료', 'rent'),
+            ('광고선전비', 'advertising'),
+            ('소모품비', 'supplies'),
+        ]
+        for idx, (name, exp_type) in enumerate(expense_types):
+            expense_categories.append(Category.objects.create(
+                name=name,
+                type='expense',
+                expense_type=exp_type,
+                is_system=True,
+                order=idx + 1
+            ))
+        
+        yield {
+            'user': user,
+            'business': business,
+            'account': account,
+            'income_category': income_category,
+            'expense_categories': expense_categories,
+        }
+        transaction.set_rollback(True)
+
+
+@pytest.fixture(scope='class')
+def authed_client(report_data, django_db_blocker):
+    """
+    테스트 사용자로 로그인한 클라이언트 (클래스당 한 번만 로그인)
+    
+    세션은 report_data의 바깥 트랜잭션 안에 저장되므로 클래스 동안 유지되고 함께 롤백됩니다.
+    """
+    client = Client()
+    with django_db_blocker.unblock():
+        client.force_login(report_data['user'])
+    return client
+
+
 @pytest.fixture
-def user(db):
-    """테스트 사용자 생성"""
-    return User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )
+def user(db, report_data):
+    """테스트 사용자"""
+    return report_data['user']
 
 
 @pytest.fixture
-def business(db, user):
-    """테스트 사업장 생성"""
-    return Business.objects.create(
-        user=user,
-        name='테스트 사업장',
-        business_type='음식점',
-        branch_type='main'
-    )
+def business(report_data):
+    """테스트 사업장"""
+    return report_data['business']
 
 
 @pytest.fixture
-def account(db, user, business):
-    """테스트 계좌 생성"""
-    return Account.objects.create(
-        user=user,
-        business=business,
-        name='테스트 계좌',
-        bank_name='테스트은행',
-        account_number='1234567890',
-        balance=Decimal('0')
-    )
+def account(report_data):
+    """테스트 계좌"""
+    return report_data['account']
 
 
 @pytest.fixture
-def income_category(db):
-    """수입 카테고리 생성"""
-    return Category.objects.create(
-        name='매출',
-        type='income',
-        is_system=True,
-        order=1
-    )
+def income_category(report_data):
+    """수입 카테고리"""
+    return report_data['income_category']
 
 
 @pytest.fixture
-def expense_categories(db):
-    """지출 카테고리들 생성"""
-    categories = []
-    expense_types = [
-        ('인건비', 'salary'),
-        ('임차료', 'rent'),
-        ('광고선전비', 'advertising'),
-        ('소모품비', 'supplies'),
-    ]
-    
-    for idx, (name, exp_type) in enumerate(expense_types):
-        cat = Category.objects.create(
-            name=name,
-            type='expense',
-            expense_type=exp_type,
-            is_system=True,
-            order=idx + 1
-        )
-        categories.append(cat)
-    
-    return categories
+def expense_categories(report_data):
+    """지출 카테고리들"""
+    return report_data['expense_categories']
+
+
+@pytest.fixture
+def expense_category_map(expense_categories):
+    """지출 카테고리 {이름: 카테고리}"""
+    return {cat.name: cat for cat in expense_categories}
 
 
 @pytest.mark.django_db
 class TestIncomeTaxReportView:
     """종합소득세 리포트 뷰 테스트"""
     
-    def test_login_required(self, client):
+    def test_login_required(self, client, tax_report_url):
         """로그인 필수 확인"""
-        url = reverse('tax:income_tax_report')
-        response = client.get(url)
+        response = client.get(tax_report_url)
         
         # 로그인 페이지로 리다이렉트
         assert response.status_code == 302
         assert 'login' in response.url
     
-    def test_no_transactions_message(self, client, user):
+    def test_no_transactions_message(self, authed_client, tax_report_url):
         """거래 없는 경우 안내 메시지"""
-        client.force_login(user)
-        url = reverse('tax:income_tax_report')
         
-        response = client.get(url)
+        response = authed_client.get(tax_report_url)
         
         assert response.status_code == 200
         assert 'has_data' in response.context
@@ -114,19 +164,18 @@ class TestIncomeTaxReportView:
     
     def test_basic_tax_calculation(
         self, 
-        client, 
+        authed_client,
         user, 
         business, 
         account, 
         income_category, 
-        expense_categories
+        expense_category_map,
+        tax_report_url
     ):
         """기본 세금 계산 로직"""
-        client.force_login(user)
-        
         # 2024년 거래 생성
         year = 2024
-        base_date = datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        base_date = BASE_DATE_2024
         
         # 수입: 5,000만원
         Transaction.objects.create(
@@ -149,23 +198,23 @@ class TestIncomeTaxReportView:
             ('소모품비', Decimal('2000000')),
         ]
         
-        for cat_name, amount in expenses:
-            cat = next(c for c in expense_categories if c.name == cat_name)
-            Transaction.objects.create(
+        Transaction.objects.bulk_create([
+            Transaction(
                 user=user,
                 business=business,
                 account=account,
-                category=cat,
+                category=expense_category_map[cat_name],
                 tx_type='OUT',
                 amount=amount,
                 occurred_at=base_date + timedelta(days=1),
                 merchant_name='공급업체',
                 is_business=True
             )
+            for cat_name, amount in expenses
+        ])
         
         # 리포트 요청
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': year})
+        response = authed_client.get(tax_report_url, {'year': year})
         
         assert response.status_code == 200
         assert response.context['has_data'] is True
@@ -187,18 +236,17 @@ class TestIncomeTaxReportView:
     
     def test_simple_vs_actual_comparison(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
         income_category,
-        expense_categories
+        expense_categories,
+        tax_report_url
     ):
         """실제지출 vs 단순경비율 비교"""
-        client.force_login(user)
-        
         year = 2024
-        base_date = datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        base_date = BASE_DATE_2024
         
         # 수입: 3,000만원
         Transaction.objects.create(
@@ -227,8 +275,7 @@ class TestIncomeTaxReportView:
         )
         
         # 음식점 업종으로 조회 (경비율 90%)
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {
+        response = authed_client.get(tax_report_url, {
             'year': year,
             'business_type': 'restaurant'
         })
@@ -251,18 +298,17 @@ class TestIncomeTaxReportView:
     
     def test_actual_method_better(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
         income_category,
-        expense_categories
+        expense_categories,
+        tax_report_url
     ):
         """실제지출 방식이 유리한 경우"""
-        client.force_login(user)
-        
         year = 2024
-        base_date = datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        base_date = BASE_DATE_2024
         
         # 수입: 2,000만원
         Transaction.objects.create(
@@ -291,8 +337,7 @@ class TestIncomeTaxReportView:
         )
         
         # IT 업종으로 조회 (경비율 45% - 낮음)
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {
+        response = authed_client.get(tax_report_url, {
             'year': year,
             'business_type': 'it'
         })
@@ -310,18 +355,17 @@ class TestIncomeTaxReportView:
     
     def test_category_tax_impact(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
         income_category,
-        expense_categories
+        expense_category_map,
+        tax_report_url
     ):
         """카테고리별 절세 효과 계산"""
-        client.force_login(user)
-        
         year = 2024
-        base_date = datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        base_date = BASE_DATE_2024
         
         # 수입
         Transaction.objects.create(
@@ -344,22 +388,22 @@ class TestIncomeTaxReportView:
             ('소모품비', Decimal('1000000')),  # 가장 작음
         ]
         
-        for cat_name, amount in expenses:
-            cat = next(c for c in expense_categories if c.name == cat_name)
-            Transaction.objects.create(
+        Transaction.objects.bulk_create([
+            Transaction(
                 user=user,
                 business=business,
                 account=account,
-                category=cat,
+                category=expense_category_map[cat_name],
                 tx_type='OUT',
                 amount=amount,
                 occurred_at=base_date + timedelta(days=1),
                 merchant_name='공급업체',
                 is_business=True
             )
+            for cat_name, amount in expenses
+        ])
         
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': year})
+        response = authed_client.get(tax_report_url, {'year': year})
         
         # 카테고리별 절세 효과 확인
         category_impact = response.context['category_impact']
@@ -375,50 +419,41 @@ class TestIncomeTaxReportView:
     
     def test_monthly_cumulative_data(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
         income_category,
-        expense_categories
+        expense_categories,
+        tax_report_url
     ):
         """월별 누적 데이터 생성"""
-        client.force_login(user)
-        
         year = 2024
         
-        # 1월부터 6월까지 거래 생성
-        for month in range(1, 7):
-            month_date = datetime(year, month, 15, 12, 0, 0, tzinfo=timezone.utc)
-            
-            # 매월 수입 500만원
-            Transaction.objects.create(
+        # 1월부터 6월까지 거래 생성 (매월 수입 500만원 + 지출 300만원, INSERT 한 번)
+        # bulk_create는 save()를 거치지 않으므로 계좌 잔액/부가세는 갱신되지 않음 (리포트와 무관)
+        month_dates = MONTH_DATES_2024[:6]
+        Transaction.objects.bulk_create([
+            Transaction(
                 user=user,
                 business=business,
                 account=account,
-                category=income_category,
-                tx_type='IN',
-                amount=Decimal('5000000'),
-                occurred_at=month_date,
-                merchant_name='고객',
+                category=category,
+                tx_type=tx_type,
+                amount=amount,
+                occurred_at=occurred_at,
+                merchant_name=merchant_name,
                 is_business=True
             )
-            
-            # 매월 지출 300만원
-            Transaction.objects.create(
-                user=user,
-                business=business,
-                account=account,
-                category=expense_categories[0],
-                tx_type='OUT',
-                amount=Decimal('3000000'),
-                occurred_at=month_date + timedelta(days=1),
-                merchant_name='공급업체',
-                is_business=True
+            for month_date in month_dates
+            for category, tx_type, amount, occurred_at, merchant_name in (
+                (income_category, 'IN', Decimal('5000000'), month_date, '고객'),
+                (expense_categories[0], 'OUT', Decimal('3000000'),
+                 month_date + timedelta(days=1), '공급업체'),
             )
+        ], batch_size=500)
         
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': year})
+        response = authed_client.get(tax_report_url, {'year': year})
         
         # 월별 데이터 확인
         monthly_data = response.context['monthly_data']
@@ -443,10 +478,8 @@ class TestIncomeTaxReportView:
         # 마지막 월 세금 확인
         assert response.context['last_month_tax'] == monthly_data[-1]['tax']
     
-    def test_different_years(self, client, user, business, account, income_category):
+    def test_different_years(self, authed_client, user, business, account, income_category, tax_report_url):
         """연도별 데이터 분리"""
-        client.force_login(user)
-        
         # 2023년 거래
         Transaction.objects.create(
             user=user,
@@ -455,7 +488,7 @@ class TestIncomeTaxReportView:
             category=income_category,
             tx_type='IN',
             amount=Decimal('10000000'),
-            occurred_at=datetime(2023, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
+            occurred_at=BASE_DATE_2023,
             merchant_name='고객',
             is_business=True
         )
@@ -468,33 +501,31 @@ class TestIncomeTaxReportView:
             category=income_category,
             tx_type='IN',
             amount=Decimal('20000000'),
-            occurred_at=datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
+            occurred_at=BASE_DATE_2024,
             merchant_name='고객',
             is_business=True
         )
         
         # 2024년 조회
-        url = reverse('tax:income_tax_report')
-        response_2024 = client.get(url, {'year': 2024})
+        response_2024 = authed_client.get(tax_report_url, {'year': 2024})
         
         # 2024년 데이터만 나와야 함
         assert response_2024.context['total_income'] == Decimal('20000000')
         
         # 2023년 조회
-        response_2023 = client.get(url, {'year': 2023})
+        response_2023 = authed_client.get(tax_report_url, {'year': 2023})
         assert response_2023.context['total_income'] == Decimal('10000000')
     
     def test_deduction_amount_effect(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
-        income_category
+        income_category,
+        tax_report_url
     ):
         """소득공제액 변경 시 세금 변화"""
-        client.force_login(user)
-        
         year = 2024
         
         # 수입 2,000만원
@@ -505,21 +536,20 @@ class TestIncomeTaxReportView:
             category=income_category,
             tx_type='IN',
             amount=Decimal('20000000'),
-            occurred_at=datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
+            occurred_at=BASE_DATE_2024,
             merchant_name='고객',
             is_business=True
         )
         
-        url = reverse('tax:income_tax_report')
         
         # 기본 공제 150만원
-        response_base = client.get(url, {
+        response_base = authed_client.get(tax_report_url, {
             'year': year,
             'deduction_amount': '1500000'
         })
         
         # 추가 공제 300만원
-        response_more = client.get(url, {
+        response_more = authed_client.get(tax_report_url, {
             'year': year,
             'deduction_amount': '3000000'
         })
@@ -535,30 +565,26 @@ class TestIncomeTaxReportView:
 class TestIncomeTaxReportEdgeCases:
     """엣지 케이스 테스트"""
     
-    def test_zero_income(self, client, user):
+    def test_zero_income(self, authed_client, tax_report_url):
         """수입이 0원인 경우"""
-        client.force_login(user)
-        
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': 2024})
+        response = authed_client.get(tax_report_url, {'year': 2024})
         
         # 거래가 없으면 has_data=False
         assert response.context['has_data'] is False
     
     def test_loss_situation(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
         income_category,
-        expense_categories
+        expense_categories,
+        tax_report_url
     ):
         """지출이 수입보다 많은 경우 (적자)"""
-        client.force_login(user)
-        
         year = 2024
-        base_date = datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        base_date = BASE_DATE_2024
         
         # 수입 1,000만원
         Transaction.objects.create(
@@ -586,8 +612,7 @@ class TestIncomeTaxReportEdgeCases:
             is_business=True
         )
         
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': year})
+        response = authed_client.get(tax_report_url, {'year': year})
         
         # 소득금액이 음수
         assert response.context['actual_income_amount'] == Decimal('-5000000')
@@ -600,15 +625,14 @@ class TestIncomeTaxReportEdgeCases:
     
     def test_large_amounts(
         self,
-        client,
+        authed_client,
         user,
         business,
         account,
-        income_category
+        income_category,
+        tax_report_url
     ):
         """대용량 금액 처리 (10억 이상)"""
-        client.force_login(user)
-        
         year = 2024
         
         # 수입 20억원
@@ -619,13 +643,12 @@ class TestIncomeTaxReportEdgeCases:
             category=income_category,
             tx_type='IN',
             amount=Decimal('2000000000'),
-            occurred_at=datetime(year, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
+            occurred_at=BASE_DATE_2024,
             merchant_name='대형 고객',
             is_business=True
         )
         
-        url = reverse('tax:income_tax_report')
-        response = client.get(url, {'year': year})
+        response = authed_client.get(tax_report_url, {'year': year})
         
         assert response.status_code == 200
         assert response.context['total_income'] == Decimal('2000000000')
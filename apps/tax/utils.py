@@ -4,10 +4,16 @@
 TODO: 향후 세율 정보가 빈번하게 변경될 경우,
 관리자 페이지에서 수정 가능하도록 DB(Table)화 및 캐싱 로직 도입 검토 예정
 """
+from bisect import bisect_left
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, Optional, List
 
 
+# 금액 반올림 단위 (소수점 2자리)
+_CENT = Decimal('0.01')
+
+
 # 2024년 종합소득세 세율표
 TAX_BRACKETS_2024 = [
     {'limit': Decimal('14000000'), 'rate': Decimal('0.06'), 'deduction': Decimal('0')},
@@ -23,6 +29,9 @@ TAX_BRACKETS_2024 = [
 # 2025년 세율표 (동일)
 TAX_BRACKETS_2025 = TAX_BRACKETS_2024.copy()
 
+# 구간 한도 (오름차순) - 과세표준 이상인 첫 한도를 이분 탐색으로 찾기 위함
+_BRACKET_LIMITS = tuple(bracket['limit'] for bracket in TAX_BRACKETS_2024)
+
 
 # 단순경비율 (주요 업종만)
 SIMPLE_EXPENSE_RATES = {
@@ -67,6 +76,19 @@ def get_tax_brackets(year: int) -> List[Dict]:
         return TAX_BRACKETS_2024  # 과거 연도도 동일 적용
 
 
+# 과세표준 0 이하일 때의 결과 (호출자에게는 복사본을 반환)
+_ZERO_TAX_RESULT = {
+    'tax': Decimal('0'),
+    'rate': Decimal('0'),
+    'deduction': Decimal('0'),
+    'local_tax': Decimal('0'),
+    'total': Decimal('0')
+}
+
+# 계산 결과 캐시 크기 (세율표가 모듈 상수이므로 같은 입력은 항상 같은 결과)
+_CALCULATION_CACHE_SIZE = 4096
+
+
 def calculate_tax(taxable_income: Decimal) -> Dict[str, Decimal]:
     """
     과세표준에 세율 적용
@@ -83,41 +105,38 @@ def calculate_tax(taxable_income: Decimal) -> Dict[str, Decimal]:
             'total': 총 세액
         }
     """
+    # 과세표준 0 이하 (적자/공제 초과)는 구간 탐색 없이 바로 0원
     if taxable_income <= 0:
+        return dict(_ZERO_TAX_RESULT)
+    
+    # 캐시된 dict를 호출자가 수정해도 다른 호출에 영향이 없도록 복사해서 반환
+    return dict(_calculate_tax_cached(taxable_income))
+
+
+@lru_cache(maxsize=_CALCULATION_CACHE_SIZE)
+def _calculate_tax_cached(taxable_income: Decimal) -> Dict[str, Decimal]:
+    """calculate_tax() 실제 계산 (과세표준 값별로 캐시)"""
+    # 해당 세율 구간 찾기 (과세표준 <= 한도인 첫 구간)
+    index = bisect_left(_BRACKET_LIMITS, taxable_income)
+    if index < len(TAX_BRACKETS_2024):
+        bracket = TAX_BRACKETS_2024[index]
+        tax = (taxable_income * bracket['rate']) - bracket['deduction']
+        tax = max(tax, Decimal('0'))  # 음수 방지
+        
+        local_tax = tax * Decimal('0.1')  # 지방소득세 10%
+        total = tax + local_tax
+        
         return {
-            'tax': Decimal('0'),
-            'rate': Decimal('0'),
-            'deduction': Decimal('0'),
-            'local_tax': Decimal('0'),
-            'total': Decimal('0')
+            'tax': tax.quantize(_CENT),
+            'rate': bracket['rate'],
+            'rate_percent': float(bracket['rate'] * 100),
+            'deduction': bracket['deduction'],
+            'local_tax': local_tax.quantize(_CENT),
+            'total': total.quantize(_CENT)
         }
     
-    # 해당 세율 구간 찾기
-    for bracket in TAX_BRACKETS_2024:
-        if taxable_income <= bracket['limit']:
-            tax = (taxable_income * bracket['rate']) - bracket['deduction']
-            tax = max(tax, Decimal('0'))  # 음수 방지
-            
-            local_tax = tax * Decimal('0.1')  # 지방소득세 10%
-            total = tax + local_tax
-            
-            return {
-                'tax': tax.quantize(Decimal('0.01')),
-                'rate': bracket['rate'],
-                'rate_percent': float(bracket['rate'] * 100),
-                'deduction': bracket['deduction'],
-                'local_tax': local_tax.quantize(Decimal('0.01')),
-                'total': total.quantize(Decimal('0.01'))
-            }
-    
     # 여기 도달하면 안 됨
-    return {
-        'tax': Decimal('0'),
-        'rate': Decimal('0'),
-        'deduction': Decimal('0'),
-        'local_tax': Decimal('0'),
-        'total': Decimal('0')
-    }
+    return _ZERO_TAX_RESULT
 
 
 def calculate_simple_expense_method(
@@ -134,6 +153,13 @@ def calculate_simple_expense_method(
     Returns:
         계산 결과 또는 None (적용 불가 시)
     """
+    result = _calculate_simple_expense_cached(total_income, business_type)
+    return dict(result) if result is not None else None
+
+
+@lru_cache(maxsize=_CALCULATION_CACHE_SIZE)
+def _calculate_simple_expense_cached(total_income: Decimal, business_type: str) -> Optional[Dict]:
+    """calculate_simple_expense_method() 실제 계산 ((수입금액, 업종)별로 캐시)"""
     if business_type not in SIMPLE_EXPENSE_RATES:
         return None
     
@@ -157,8 +183,8 @@ def calculate_simple_expense_method(
         'business_type_name': rate_info['name'],
         'rate': rate_info['rate'],
         'rate_percent': float(rate_info['rate'] * 100),
-        'expense': expense.quantize(Decimal('0.01')),
-        'income_amount': income_amount.quantize(Decimal('0.01')),
+        'expense': expense.quantize(_CENT),
+        'income_amount': income_amount.quantize(_CENT),
         'limit': rate_info['limit']
     }
 
@@ -185,7 +211,7 @@ def get_category_tax_impact(
         results.append({
             'category': category or '미분류',
             'amount': amount,
-            'tax_saved': tax_saved.quantize(Decimal('0.01'))
+            'tax_saved': tax_saved.quantize(_CENT)
         })
     
     # 금액 큰 순으로 정렬
@@ -204,37 +230,38 @@ def calculate_next_bracket_distance(taxable_income: Decimal) -> Optional[Dict]:
     Returns:
         다음 구간 정보 또는 None (최고 구간)
     """
-    for i, bracket in enumerate(TAX_BRACKETS_2024):
-        if taxable_income <= bracket['limit']:
-            # 현재 구간
-            current_rate = bracket['rate']
-            
-            # 다음 구간이 있는지 확인
-            if i < len(TAX_BRACKETS_2024) - 1:
-                next_bracket = TAX_BRACKETS_2024[i + 1]
-                distance = bracket['limit'] - taxable_income
-                
-                return {
-                    'current_rate': current_rate,
-                    'current_rate_percent': float(current_rate * 100),
-                    'next_rate': next_bracket['rate'],
-                    'next_rate_percent': float(next_bracket['rate'] * 100),
-                    'distance': distance.quantize(Decimal('0.01')),
-                    'next_limit': bracket['limit']
-                }
-            else:
-                # 최고 구간
-                return {
-                    'current_rate': current_rate,
-                    'current_rate_percent': float(current_rate * 100),
-                    'next_rate': None,
-                    'next_rate_percent': None,
-                    'distance': None,
-                    'next_limit': None,
-                    'is_max': True
-                }
+    i = bisect_left(_BRACKET_LIMITS, taxable_income)
+    if i == len(TAX_BRACKETS_2024):
+        return None
+    
+    # 현재 구간
+    bracket = TAX_BRACKETS_2024[i]
+    current_rate = bracket['rate']
     
-    return None
+    # 다음 구간이 있는지 확인
+    if i < len(TAX_BRACKETS_2024) - 1:
+        next_bracket = TAX_BRACKETS_2024[i + 1]
+        distance = bracket['limit'] - taxable_income
+        
+        return {
+            'current_rate': current_rate,
+            'current_rate_percent': float(current_rate * 100),
+            'next_rate': next_bracket['rate'],
+            'next_rate_percent': float(next_bracket['rate'] * 100),
+            'distance': distance.quantize(_CENT),
+            'next_limit': bracket['limit']
+        }
+    
+    # 최고 구간
+    return {
+        'current_rate': current_rate,
+        'current_rate_percent': float(current_rate * 100),
+        'next_rate': None,
+        'next_rate_percent': None,
+        'distance': None,
+        'next_limit': None,
+        'is_max': True
+    }
 
 
 def get_tax_saving_tip(
@@ -3,7 +3,7 @@
 """
 import logging
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
@@ -22,6 +22,21 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# 소득공제액 기본값 (기본 인적공제 150만원)
+DEFAULT_DEDUCTION_AMOUNT = Decimal('1500000')
+
+
+def _parse_deduction_amount(raw):
+    """소득공제액 GET 파라미터를 Decimal로 변환 (없거나 숫자가 아니면 기본값)"""
+    if not raw:
+        return DEFAULT_DEDUCTION_AMOUNT
+    try:
+        amount = Decimal(raw)
+    except InvalidOperation:
+        return DEFAULT_DEDUCTION_AMOUNT
+    # 'NaN', 'Infinity'도 Decimal 변환은 되지만 세액 계산에 쓸 수 없음
+    return amount if amount.is_finite() else DEFAULT_DEDUCTION_AMOUNT
+
 
 @login_required
 def income_tax_report(request):
@@ -38,13 +53,12 @@ def income_tax_report(request):
     current_year = datetime.now().year
     
     # GET 파라미터 또는 기본값
-    selected_year = int(request.GET.get('year', current_year - 1))
-    business_type = request.GET.get('business_type', '')
-    
     try:
-        deduction_amount = Decimal(request.GET.get('deduction_amount', '1500000'))
-    except:
-        deduction_amount = Decimal('1500000')
+        selected_year = int(request.GET.get('year', current_year - 1))
+    except (ValueError, TypeError):
+        selected_year = current_year - 1
+    business_type = request.GET.get('business_type', '')
+    deduction_amount = _parse_deduction_amount(request.GET.get('deduction_amount'))
     
     # 폼 생성
     form = IncomeTaxCalculationForm(
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-16 20:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('businesses', '0006_remove_business_branch_code_and_more'),
+        ('transactions', '0002_alter_merchant_is_active_alter_transaction_is_active'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['account', '-occurred_at', '-id'], name='tx_active_recent'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-16 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0003_transaction_tx_active_recent'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['business', 'tx_type', 'occurred_at'], name='tx_active_business_stats'),
+        ),
+    ]
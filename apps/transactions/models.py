@@ -213,6 +213,24 @@ class Transaction(SoftDeleteModel):
             models.Index(fields=['business', '-occurred_at']),
             models.Index(fields=['account', '-occurred_at']),
             models.Index(fields=['user', 'is_business', 'tax_type', 'occurred_at']),
+            # 활성 거래 목록 (Transaction.active.filter(user=...) 최신순)
+            models.Index(
+                fields=['user', '-occurred_at'],
+                condition=models.Q(is_active=True),
+                name='tx_active_by_user',
+            ),
+            # 계좌 상세의 최근 거래 5건: 활성 거래만 담은 부분 인덱스를 정렬 순서 그대로 스캔
+            models.Index(
+                fields=['account', '-occurred_at', '-id'],
+                condition=models.Q(is_active=True),
+                name='tx_active_recent',
+            ),
+            # 사업장 통계: business + tx_type 동등 조건 뒤 occurred_at 기간 범위
+            models.Index(
+                fields=['business', 'tx_type', 'occurred_at'],
+                condition=models.Q(is_active=True),
+                name='tx_active_business_stats',
+            ),
         ]
         constraints = [
             models.CheckConstraint(condition=models.Q(amount__gt=0), name='transaction_amount_positive'),